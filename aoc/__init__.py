@@ -0,0 +1,52 @@
+import os.path
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+DAYS = range(1, 26)
+
+
+def day_path(day: int, name: str = "") -> str:
+    return os.path.join(ROOT, f"day{day:02d}", name or f"day{day:02d}.py")
+
+
+def available_days() -> list[int]:
+    return [day for day in DAYS if os.path.isfile(day_path(day))]
+
+
+# "1-25", "7" or "1,3,5-9"
+def parse_days(spec: str) -> list[int]:
+    days: list[int] = []
+    for part in spec.split(","):
+        first, _, last = part.partition("-")
+        days.extend(range(int(first), int(last or first)+1))
+    if not all(day in DAYS for day in days):
+        raise ValueError(f"Days must be within {DAYS.start}-{DAYS.stop-1}, got '{spec}'")
+    return days
+
+
+# every day exposes parse(data), part1(parsed) and part2(parsed)
+def load(day: int, variant: str = "") -> ModuleType:
+    return import_module(f"day{day:02d}.{variant or f'day{day:02d}'}")
+
+
+def input_path(day: int, input_dir: str = ROOT) -> str:
+    return os.path.join(input_dir, f"day{day:02d}", "input.txt")
+
+
+def read_input(day: int, input_dir: str = ROOT) -> str:
+    with open(input_path(day, input_dir)) as f:
+        return f.read()
+
+
+# parse once, then run the requested parts on the same parsed input
+# missing parts (i.e. day 25 part 2) are skipped
+def solve(day: int, parts: tuple[int, ...] = (1, 2), input_dir: str = ROOT) -> dict[int, Any]:
+    module = load(day)
+    parsed = module.parse(read_input(day, input_dir))
+    results: dict[int, Any] = {}
+    for part in parts:
+        if (solver := getattr(module, f"part{part}", None)) is not None:
+            results[part] = solver(parsed)
+    return results
@@ -0,0 +1,76 @@
+import argparse
+import os.path
+import sys
+from timeit import default_timer as timer
+
+from aoc import ROOT, available_days, input_path, parse_days, solve
+from aoc.bench import BENCHMARKS, bench_all, write_json
+
+
+def run(args: argparse.Namespace) -> int:
+    parts = (args.part,) if args.part else (1, 2)
+    solved = available_days()
+    missing = [day for day in args.days if day not in solved]
+    if missing:
+        print("No solver for day(s):", ", ".join(map(str, missing)), file=sys.stderr)
+    no_input = [day for day in args.days
+                if day not in missing and not os.path.isfile(input_path(day, args.input_dir))]
+    if no_input:
+        print("No input for day(s):", ", ".join(map(str, no_input)), file=sys.stderr)
+
+    # the remaining days still run, the exit code reports the skipped ones
+    for day in args.days:
+        if day in missing or day in no_input:
+            continue
+        s = timer()
+        results = solve(day, parts, args.input_dir)
+        e = timer()
+        for part, res in results.items():
+            print(f"Day {day:02d} Part {part}: {res}")
+        if args.time:
+            print(f"Day {day:02d} time: {e-s}")
+    return 1 if missing or no_input else 0
+
+
+def bench(args: argparse.Namespace) -> int:
+    names = args.names or list(BENCHMARKS)
+    report = bench_all(names, args.repeat, args.warmup, args.input_dir)
+    for name, result in report["benchmarks"].items():
+        for impl, stats in result["implementations"].items():
+            print(f"{name:<14} {impl:<10} min {stats['min']:.6f}  median {stats['median']:.6f}"
+                  f"  stddev {stats['stddev']:.6f}")
+        print(f"{name:<14} fastest: {result['fastest']}")
+        if not result["agree"]:
+            print(f"{name:<14} implementations disagree: {result['answers']}", file=sys.stderr)
+    if args.output:
+        write_json(report, args.output)
+    return 0 if report["agree"] else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Advent of Code 2020 solvers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="solve one or more days")
+    run_parser.add_argument("days", nargs="?", default="1-25", type=parse_days,
+                            help="i.e. 1-25, 7 or 1,3,5-9 (default: 1-25)")
+    run_parser.add_argument("--part", type=int, choices=(1, 2), help="only solve this part")
+    run_parser.add_argument("--input-dir", default=ROOT, help="directory containing dayNN/input.txt")
+    run_parser.add_argument("--time", action="store_true", help="print time per day")
+    run_parser.set_defaults(func=run)
+
+    bench_parser = commands.add_parser("bench", help="compare alternative implementations")
+    bench_parser.add_argument("names", nargs="*", choices=list(BENCHMARKS), metavar="name",
+                              help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="timed runs per implementation")
+    bench_parser.add_argument("--warmup", type=int, default=1, help="untimed runs per implementation")
+    bench_parser.add_argument("--input-dir", default=ROOT, help="directory containing dayNN/input.txt")
+    bench_parser.add_argument("--output", help="write results as JSON to this file")
+    bench_parser.set_defaults(func=bench)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
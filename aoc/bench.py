@@ -0,0 +1,184 @@
+import json
+import platform
+import statistics
+from collections.abc import Callable
+from timeit import default_timer as timer
+from typing import Any
+
+from aoc import ROOT, load, read_input
+
+type Run = Callable[[], Any]  # one timed call, returns a comparable answer
+type Setup = Callable[[str], Run]  # untimed: parse raw input, return the timed call
+type Benchmark = tuple[int, dict[str, Setup]]  # (day, {implementation: setup})
+
+
+def _day11(part: int, mode: str) -> Setup:
+    def setup(data: str) -> Run:
+        day11 = load(11)
+        empty, dimy, dimx = day11.parse(data)
+
+        # the neighborhood search is timed, just like the closest seat search of the numpy variant
+        def run() -> int:
+            neighborhood = day11.precompute_neighborhood(empty, dimy, dimx, part2=part == 2)
+            return day11.equilibrium(empty, neighborhood, 4 if part == 1 else 5, mode)
+        return run
+    return setup
+
+
+def _day11_numpy(part: int) -> Setup:
+    def setup(data: str) -> Run:
+        day11_numpy = load(11, "day11_numpy")
+        grid = day11_numpy.parse(data)
+        return lambda: int(getattr(day11_numpy, f"part{part}")(grid))
+    return setup
+
+
+def _day13(mode: str) -> Setup:
+    def setup(data: str) -> Run:
+        day13 = load(13)
+        notes = day13.parse(data)
+        return lambda: day13.part2(notes, mode)
+    return setup
+
+
+def _day14(mode: str) -> Setup:
+    def setup(data: str) -> Run:
+        day14 = load(14)
+        program = day14.parse(data)
+        return lambda: day14.part2(program, mode)
+    return setup
+
+
+def _day15(mode: str) -> Setup:
+    def setup(data: str) -> Run:
+        day15 = load(15)
+        numbers = day15.parse(data)
+        return lambda: day15.memory_game(numbers, 30_000_000, mode)
+    return setup
+
+
+def _day16(mode: str) -> Setup:
+    def setup(data: str) -> Run:
+        day16 = load(16)
+        ranges, _, nearby = day16.parse(data)
+        return lambda: day16.error_rate(ranges, nearby, mode)
+    return setup
+
+
+def _day17(mode: str) -> Setup:
+    def setup(data: str) -> Run:
+        day17 = load(17)
+        grid = day17.parse(data)
+        return lambda: int(day17.solve(grid, 4, 6, mode))
+    return setup
+
+
+def _day23(part: int, mode: str) -> Setup:
+    def setup(data: str) -> Run:
+        day23 = load(23)
+        initial = day23.parse(data)
+        return lambda: getattr(day23, f"part{part}")(initial, mode)
+    return setup
+
+
+def _day23_deque(data: str) -> Run:
+    p1_deque = load(23, "p1_deque")
+    cups = list(map(int, data.strip()))
+    return lambda: p1_deque.play_cup_game(cups, 100)
+
+
+def _day24_sets(data: str) -> Run:
+    day24 = load(24)
+    black = day24.parse(data)
+    return lambda: len(day24.conway(black, 100))
+
+
+def _day24_convolve(data: str) -> Run:
+    day24 = load(24)
+    black = day24.parse(data)
+    return lambda: int(day24.conway_convolve(black, 100))
+
+
+def _day24_axial(data: str) -> Run:
+    day24 = load(24)
+    black = day24.parse(data)
+    return lambda: day24.conway_axial(black, 100)
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "day11-part1": (11, {"full": _day11(1, "full"), "frontier": _day11(1, "frontier"), "numpy": _day11_numpy(1)}),
+    "day11-part2": (11, {"full": _day11(2, "full"), "frontier": _day11(2, "frontier"), "numpy": _day11_numpy(2)}),
+    "day13-part2": (13, {"z3": _day13("z3"), "crt": _day13("crt")}),
+    "day14-part2": (14, {"expand": _day14("expand"), "patterns": _day14("patterns")}),
+    "day15-part2": (15, {"dict": _day15("dict"), "array": _day15("array")}),
+    "day16-part1": (16, {"linear": _day16("linear"), "bisect": _day16("bisect"), "numpy": _day16("numpy")}),
+    "day17-part2": (17, {"dense": _day17("dense"), "sparse": _day17("sparse")}),
+    "day23-part1": (23, {"linked": _day23(1, "linked"), "array": _day23(1, "array"), "deque": _day23_deque}),
+    "day23-part2": (23, {"linked": _day23(2, "linked"), "array": _day23(2, "array")}),
+    "day24-part2": (24, {"sets": _day24_sets, "convolve": _day24_convolve, "axial": _day24_axial}),
+}
+
+
+def measure(run: Run, repeat: int, warmup: int) -> tuple[Any, list[float]]:
+    res = None
+    for _ in range(warmup):
+        res = run()
+    times = []
+    for _ in range(repeat):
+        s = timer()
+        res = run()
+        e = timer()
+        times.append(e - s)
+    return res, times
+
+
+def summarize(times: list[float]) -> dict[str, Any]:
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "runs": times,
+    }
+
+
+# every implementation of a benchmark runs on the same parsed input
+# answers must agree, otherwise the comparison is meaningless: the mismatch is recorded, not raised,
+# so the remaining benchmarks still run and get reported
+def bench(name: str, repeat: int = 5, warmup: int = 1, input_dir: str = ROOT) -> dict[str, Any]:
+    day, implementations = BENCHMARKS[name]
+    data = read_input(day, input_dir)
+
+    results: dict[str, Any] = {}
+    answers: dict[str, str] = {}
+    for impl, setup in implementations.items():
+        answer, times = measure(setup(data), repeat, warmup)
+        answers[impl] = repr(answer)
+        results[impl] = summarize(times)
+
+    agree = len(set(answers.values())) == 1
+    return {
+        "day": day,
+        "agree": agree,
+        "answer": next(iter(answers.values())) if agree else None,
+        "answers": answers,
+        "fastest": min(results, key=lambda impl: results[impl]["median"]),
+        "implementations": results,
+    }
+
+
+def bench_all(names: list[str], repeat: int = 5, warmup: int = 1, input_dir: str = ROOT) -> dict[str, Any]:
+    benchmarks = {name: bench(name, repeat, warmup, input_dir) for name in names}
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "agree": all(result["agree"] for result in benchmarks.values()),
+        "benchmarks": benchmarks,
+    }
+
+
+def write_json(report: dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
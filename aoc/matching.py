@@ -0,0 +1,138 @@
+from collections import deque
+from collections.abc import Hashable, Iterable, Mapping
+
+type Node = tuple[int, Hashable]  # (0, left) or (1, right), keeps both sides apart
+type Digraph = dict[Node, list[Node]]
+
+
+# https://en.wikipedia.org/wiki/Hopcroft%E2%80%93Karp_algorithm
+# maximum matching of a bipartite graph given as left -> candidates on the right, O(E sqrt(V))
+def hopcroft_karp[L: Hashable, R: Hashable](graph: Mapping[L, Iterable[R]]) -> dict[L, R]:
+    adj: dict[L, list[R]] = {u: list(vs) for u, vs in graph.items()}
+    match_l: dict[L, R] = {}
+    match_r: dict[R, L] = {}
+    dead = -1  # layer of left vertices without augmenting path in this phase
+
+    while True:
+        # bfs: layer the left vertices by alternating distance from the free ones
+        free = [u for u in adj if u not in match_l]
+        layer: dict[L, int] = {u: 0 for u in free}
+        queue = deque(free)
+        limit = len(adj)  # layer of the shortest augmenting paths
+        while queue:
+            u = queue.popleft()
+            if layer[u] >= limit:
+                continue
+            for v in adj[u]:
+                if v not in match_r:
+                    limit = layer[u]
+                elif (w := match_r[v]) not in layer:
+                    layer[w] = layer[u] + 1
+                    queue.append(w)
+        if limit == len(adj):
+            return match_l
+
+        # dfs: vertex disjoint shortest augmenting paths along the layers
+        for root in free:
+            stack: list[tuple[L, Iterable[R]]] = [(root, iter(adj[root]))]
+            path: list[R] = []
+            while stack:
+                u, candidates = stack[-1]
+                for v in candidates:
+                    if v not in match_r:
+                        if layer[u] == limit:
+                            path.append(v)
+                            for (x, _), y in zip(stack, path):
+                                match_l[x], match_r[y] = y, x
+                            stack.clear()
+                            break
+                    elif layer.get(w := match_r[v]) == layer[u] + 1:
+                        path.append(v)
+                        stack.append((w, iter(adj[w])))
+                        break
+                else:
+                    layer[u] = dead
+                    stack.pop()
+                    if path:
+                        path.pop()
+
+
+# https://en.wikipedia.org/wiki/Tarjan%27s_strongly_connected_components_algorithm
+# iterative, returns node -> id of its component
+def strongly_connected(digraph: Digraph) -> dict[Node, int]:
+    index: dict[Node, int] = {}
+    low: dict[Node, int] = {}
+    component: dict[Node, int] = {}
+    stack: list[Node] = []
+
+    for start in digraph:
+        if start in index:
+            continue
+        index[start] = low[start] = len(index)
+        stack.append(start)
+        work = [(start, iter(digraph[start]))]
+        while work:
+            node, successors = work[-1]
+            for nxt in successors:
+                if nxt not in index:
+                    index[nxt] = low[nxt] = len(index)
+                    stack.append(nxt)
+                    work.append((nxt, iter(digraph[nxt])))
+                    break
+                if nxt not in component:
+                    low[node] = min(low[node], index[nxt])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        component[member] = index[node]
+                        if member == node:
+                            break
+    return component
+
+
+def reachable(digraph: Digraph, sources: Iterable[Node]) -> set[Node]:
+    seen = set(sources)
+    queue = deque(seen)
+    while queue:
+        for nxt in digraph[queue.popleft()]:
+            if nxt not in seen:
+                seen.add(nxt)
+                queue.append(nxt)
+    return seen
+
+
+# pairs of a maximum matching that are part of every maximum matching
+# unmatched edges point left -> right, matched edges right -> left
+# a pair can be swapped out iff it lies on an alternating cycle (same component)
+# or on an even alternating path from a free vertex (reachable from a free left / reaching a free right)
+def forced_pairs[L: Hashable, R: Hashable](graph: Mapping[L, Iterable[R]], matching: Mapping[L, R]) -> dict[L, R]:
+    digraph: Digraph = {}
+    reverse: Digraph = {}
+    for u, vs in graph.items():
+        digraph.setdefault((0, u), [])
+        reverse.setdefault((0, u), [])
+        for v in vs:
+            digraph.setdefault((1, v), [])
+            reverse.setdefault((1, v), [])
+            a, b = ((1, v), (0, u)) if matching.get(u) == v else ((0, u), (1, v))
+            digraph[a].append(b)
+            reverse[b].append(a)
+
+    matched_right = set(matching.values())
+    component = strongly_connected(digraph)
+    from_free_left = reachable(digraph, ((0, u) for u in graph if u not in matching))
+    to_free_right = reachable(reverse, (node for node in digraph if node[0] == 1 and node[1] not in matched_right))
+
+    return {
+        u: v for u, v in matching.items()
+        if component[(0, u)] != component[(1, v)] and (1, v) not in from_free_left and (0, u) not in to_free_right
+    }
+
+
+def is_unique[L: Hashable, R: Hashable](graph: Mapping[L, Iterable[R]], matching: Mapping[L, R]) -> bool:
+    return len(forced_pairs(graph, matching)) == len(matching)
@@ -1,36 +1,80 @@
 import os.path
 from math import prod
+from collections.abc import Iterable
+import numpy as np
 
+TARGET = 2020
 
-def part1(data: list[str]) -> int:
-    seen: set[int] = set()
-    for num in map(int, data):
-        if 2020 - num in seen:
-            return (2020-num) * num
-        else:
-            seen.add(num)
-    raise ValueError("Does not compute")
 
+def parse(data: str) -> list[int]:
+    return [int(line) for line in data.splitlines()]
 
-def part2(data: list[str]) -> int:
-    seen: set[int] = set()
-    two_sum: dict[int, tuple[int, int]] = {}
-    for num in map(int, data):
-        if 2020 - num in two_sum:
-            return prod(two_sum[2020 - num]) * num
-        else:
-            for s in seen:
-                two_sum[s+num] = (s, num)
-            seen.add(num)
 
-    raise ValueError("Does not compute")
+# first combination of k entries (different positions) summing to target, smallest values first
+# sorts once, memory stays O(n) for any k
+def k_sum(values: Iterable[int], target: int, k: int) -> tuple[int, ...]:
+    if k < 1:
+        raise ValueError(f"k must be positive, got {k}")
+    ordered = np.sort(np.fromiter(values, dtype=np.int64))
+    if (res := k_sum_sorted(ordered, 0, target, k)) is None:
+        raise ValueError("Does not compute")
+    return tuple(res)
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+# search in ordered[lo:], fix the smallest entry and recurse down to the 2-sum sweep
+def k_sum_sorted(ordered: np.ndarray, lo: int, target: int, k: int) -> list[int] | None:
+    n = len(ordered)
+    if n - lo < k:
+        return None
+    if k == 1:
+        idx = lo + int(np.searchsorted(ordered[lo:], target))
+        return [target] if idx < n and ordered[idx] == target else None
+    if k == 2:
+        return two_sum_sorted(ordered[lo:], target)
 
+    largest = int(ordered[n-k+1:].sum())
+    for i in range(lo, n-k+1):
+        first = int(ordered[i])
+        # same value as before: its suffix is a subset of the one already searched
+        if i > lo and first == ordered[i-1]:
+            continue
+        # even the smallest k entries from here are too big
+        if first + int(ordered[i+1:i+k].sum()) > target:
+            break
+        # even the largest k-1 entries are too small
+        if first + largest < target:
+            continue
+        if (rest := k_sum_sorted(ordered, i+1, target-first, k-1)) is not None:
+            return [first, *rest]
+    return None
 
-print("Part 1:", part1(data))
-print("Part 2:", part2(data))
+
+# one searchsorted over the smaller halves: partner of ordered[j] is the last occurrence of target-ordered[j]
+# the smaller entry of a pair is at most target/2, so only those need to look for a partner
+def two_sum_sorted(ordered: np.ndarray, target: int) -> list[int] | None:
+    half = int(np.searchsorted(ordered, target // 2, side="right"))
+    needed = target - ordered[:half]
+    partner = np.searchsorted(ordered, needed, side="right") - 1
+    found = (partner > np.arange(half)) & (ordered[np.maximum(partner, 0)] == needed)
+    if not found.any():
+        return None
+    j = int(found.argmax())
+    return [int(ordered[j]), int(needed[j])]
+
+
+def part1(numbers: list[int]) -> int:
+    return prod(k_sum(numbers, TARGET, 2))
+
+
+def part2(numbers: list[int]) -> int:
+    return prod(k_sum(numbers, TARGET, 3))
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        numbers = parse(f.read())
+
+    print("Part 1:", part1(numbers))
+    print("Part 2:", part2(numbers))
@@ -1,26 +1,101 @@
 import os.path
 import re
+import numpy as np
 
+type Policy = tuple[int, int, str, str]  # (min, max, letter, password)
+type Columns = tuple[np.ndarray, ...]  # (min, max, letter, password start, password end, file as uint8)
 
-def solve(data: list[str]) -> tuple[int, int]:
-    p1 = p2 = 0
+
+def parse(data: str) -> list[Policy]:
+    policies: list[Policy] = []
     regex = re.compile(r"\d+")
-    for line in data:
+    for line in data.splitlines():
         policy, pwd = line.split(": ")
         letter = policy[-1]
         l_min, l_max = map(int, regex.findall(policy))
-        if l_min <= pwd.count(letter) <= l_max:
-            p1 += 1
-        if (pwd[l_min-1] == letter) ^ (pwd[l_max-1] == letter):  # XOR
-            p2 += 1
-    return p1, p2
+        policies.append((l_min, l_max, letter, pwd))
+    return policies
+
+
+def part1(policies: list[Policy]) -> int:
+    return sum(l_min <= pwd.count(letter) <= l_max for l_min, l_max, letter, pwd in policies)
+
+
+def part2(policies: list[Policy]) -> int:
+    return sum((pwd[l_min-1] == letter) ^ (pwd[l_max-1] == letter)  # XOR
+               for l_min, l_max, letter, pwd in policies)
+
+
+# digits text[first:last+1] of every row as int, numbers have at most a few digits
+def parse_numbers(text: np.ndarray, first: np.ndarray, last: np.ndarray) -> np.ndarray:
+    value = np.zeros(len(first), dtype=np.int64)
+    for d in range(int((last - first).max(initial=-1)) + 1):
+        pos = last - d
+        value += np.where(pos >= first, text[pos].astype(np.int64) - ord("0"), 0) * 10**d
+    return value
+
+
+# bulk mode: the whole file as uint8, every field is located by the separators of its line
+# "min-max letter: password"
+def parse_columns(data: str) -> Columns:
+    if data and not data.endswith("\n"):
+        data += "\n"
+    text = np.frombuffer(data.encode("ascii"), dtype=np.uint8)
+    line_end = np.flatnonzero(text == ord("\n"))
+    if len(line_end) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0, dtype=np.uint8), empty, empty, text
+    line_start = np.concatenate(([0], line_end + 1))[:-1]
+    # first "-" and ":" of every line, the password may contain more of both
+    # len(text) stands in for a separator missing from the rest of the file
+    dash = np.append(np.flatnonzero(text == ord("-")), len(text))
+    colon = np.append(np.flatnonzero(text == ord(":")), len(text))
+    dash = dash[np.searchsorted(dash, line_start)]
+    colon = colon[np.searchsorted(colon, line_start)]
+    if np.any((dash > colon) | (colon > line_end)):
+        raise ValueError("Every line must look like 'min-max letter: password'")
+
+    l_min = parse_numbers(text, line_start, dash - 1)
+    l_max = parse_numbers(text, dash + 1, colon - 3)
+    return l_min, l_max, text[colon - 1], colon + 2, line_end, text
+
+
+def part1_columns(columns: Columns) -> int:
+    l_min, l_max, letter, start, end, text = columns
+
+    if len(end) == 0:
+        return 0
+
+    # compare every character with the letter of its line, then sum over each password
+    # reduceat yields a single element for empty passwords
+    hits = (text == np.repeat(letter, np.diff(end, prepend=-1))).view(np.uint8)
+    count = np.add.reduceat(hits, np.column_stack((start, end)).ravel(), dtype=np.int64)[::2]
+    count = np.where(end > start, count, 0)
+    return int(((l_min <= count) & (count <= l_max)).sum())
+
+
+def part2_columns(columns: Columns) -> int:
+    l_min, l_max, letter, start, end, text = columns
+
+    def matches(offset: np.ndarray) -> np.ndarray:
+        pos = start + offset - 1
+        inside = (offset >= 1) & (pos < end)
+        return inside & (text[np.where(inside, pos, 0)] == letter)
+
+    return int((matches(l_min) ^ matches(l_max)).sum())
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        policies = parse(f.read())
 
+    print("Part 1:", part1(policies))
+    print("Part 2:", part2(policies))
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+    with open(input_path) as f:
+        columns = parse_columns(f.read())
 
-p1, p2 = solve(data)
-print("Part 1:", p1)
-print("Part 2:", p2)
+    print("Part 1 (bulk):", part1_columns(columns))
+    print("Part 2 (bulk):", part2_columns(columns))
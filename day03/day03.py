@@ -1,28 +1,54 @@
 import os.path
 from math import prod
+import numpy as np
 
-type Pos = tuple[int, int]  # (y,x)
+type Slope = tuple[int, int]  # (dy,dx)
+type Map = np.ndarray  # bool, True = tree, [y, x]
 
+SLOPES: list[Slope] = [(1, 1), (1, 3), (1, 5), (1, 7), (2, 1)]
 
-def count_trees(grid: set[Pos], dimy: int, dimx: int, dy: int, dx: int) -> int:
-    res = 0
-    pos: Pos = (0, 0)
-    while pos[0] <= dimy:
-        if pos in grid:
-            res += 1
-        pos = (pos[0]+dy, (pos[1] + dx) % dimx)
-    return res
 
+def parse(data: str) -> Map:
+    return np.array([[c == "#" for c in row] for row in data.splitlines()], dtype=bool)
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
 
-grid: set[Pos] = {(y, x) for y, row in enumerate(data) for x, c in enumerate(row) if c == "#"}
-dimy, dimx = len(data), len(data[0])
+# step k is at row k*dy, col (k*dx) % dimx
+def count_trees(grid: Map, dy: int, dx: int) -> int:
+    dimy, dimx = grid.shape
+    k = np.arange(-(-dimy // dy))
+    return int(grid.ravel()[k*dy*dimx + (k*dx) % dimx].sum())
 
-print("Part 1:", count_trees(grid, dimy, dimx, 1, 3))
 
-p2 = prod(count_trees(grid, dimy, dimx, dy, dx) for dy, dx in ((1, 1), (1, 3), (1, 5), (1, 7), (2, 1)))
-print("Part 2:", p2)
+# slopes sharing dy visit the same rows: one (slopes, steps) gather into the flat map per dy
+def count_trees_batch(grid: Map, slopes: list[Slope]) -> np.ndarray:
+    dimy, dimx = grid.shape
+    flat_grid = grid.ravel()
+    by_dy: dict[int, list[int]] = {}
+    for i, (dy, _) in enumerate(slopes):
+        by_dy.setdefault(dy, []).append(i)
+
+    counts = np.zeros(len(slopes), dtype=np.int64)
+    for dy, idx in by_dy.items():
+        k = np.arange(-(-dimy // dy))
+        dx = np.array([slopes[i][1] for i in idx])
+        flat = k*dy*dimx + np.multiply.outer(dx, k) % dimx
+        counts[idx] = flat_grid[flat].sum(axis=1)
+    return counts
+
+
+def part1(tree_map: Map) -> int:
+    return count_trees(tree_map, 1, 3)
+
+
+def part2(tree_map: Map) -> int:
+    return prod(count_trees_batch(tree_map, SLOPES).tolist())
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        tree_map = parse(f.read())
+
+    print("Part 1:", part1(tree_map))
+    print("Part 2:", part2(tree_map))
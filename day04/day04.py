@@ -1,67 +1,82 @@
 import os.path
 import re
+from collections.abc import Callable, Iterable, Iterator
 
+type Validator = Callable[[str], bool]
 
-def num_valid(data: str) -> int:
-    res = 0
-    regex = re.compile(r"[a-z]+:")
-    passports = data.split("\n\n")
-    for passport in passports:
-        if sum(1 for key in regex.findall(passport) if key != "cid:") == 7:
-            res += 1
-    return res
-
-
-def num_valid2(data: str) -> int:
-    VALID_HEX_COLOR = re.compile(r"^#([A-Fa-f0-9]{6})$")
-    VALID = {
-        "byr": range(1920, 2003),
-        "iyr": range(2010, 2021),
-        "eyr": range(2020, 2031),
-        "hgt": {
-            "cm": range(150, 194),
-            "in": range(59, 76)
-        },
-        "ecl": {"amb", "blu", "brn", "gry", "grn", "hzl", "oth"},
-    }
-    res = 0
-    passports = data.split("\n\n")
-    for passport in passports:
-        valid_fields = 0
-        for keyvalue in passport.replace("\n"," ").split(" "):
-            key, value = keyvalue.split(":")
-
-            if key in {"byr", "iyr", "eyr"}:
-                if int(value) not in VALID[key]:
-                    break
-
-            match key:
-                case "hgt":
-                    n = value[:-2]
-                    unit = value[-2:]
-                    if unit not in VALID[key] or int(n) not in VALID[key][unit]:
-                        break
-                case "hcl":
-                    if VALID_HEX_COLOR.search(value) is None:
-                        break
-                case "ecl":
-                    if value not in VALID[key]:
-                        break
-                case "pid":
-                    if len(value) != 9 or not value.isdigit():
-                        break
-                case "cid":
-                    continue
-            valid_fields += 1
-        res += (valid_fields == 7)
-    return res
-
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
-
-
-print("Part 1:", num_valid(data))
-print("Part 2:", num_valid2(data))
+HEX_COLOR = re.compile(r"#[A-Fa-f0-9]{6}")
+EYE_COLORS = frozenset({"amb", "blu", "brn", "gry", "grn", "hzl", "oth"})
+HEIGHTS = {"cm": range(150, 194), "in": range(59, 76)}
+
+
+def year(valid: range) -> Validator:
+    return lambda value: value.isdigit() and int(value) in valid
+
+
+def height(value: str) -> bool:
+    n, unit = value[:-2], value[-2:]
+    return unit in HEIGHTS and n.isdigit() and int(n) in HEIGHTS[unit]
+
+
+# built once, every required field is checked by its own validator, cid is ignored
+VALIDATORS: dict[str, Validator] = {
+    "byr": year(range(1920, 2003)),
+    "iyr": year(range(2010, 2021)),
+    "eyr": year(range(2020, 2031)),
+    "hgt": height,
+    "hcl": lambda value: HEX_COLOR.fullmatch(value) is not None,
+    "ecl": lambda value: value in EYE_COLORS,
+    "pid": lambda value: len(value) == 9 and value.isdigit(),
+}
+
+
+# the whole batch is validated once, both parts read from the counts
+def parse(data: str) -> tuple[int, int]:
+    return count_valid(data.splitlines())
+
+
+# passports separated by blank lines, only the current passport is held in memory
+def records(lines: Iterable[str]) -> Iterator[list[str]]:
+    fields: list[str] = []
+    for line in lines:
+        if line.strip():
+            fields.extend(line.split())
+        elif fields:
+            yield fields
+            fields = []
+    if fields:
+        yield fields
+
+
+# both parts in one pass over any line source, i.e. an open file or sys.stdin
+# (passports with all required fields, passports with all required fields valid)
+def count_valid(lines: Iterable[str]) -> tuple[int, int]:
+    complete = valid = 0
+    for fields in records(lines):
+        present = checked = 0
+        for field in fields:
+            key, _, value = field.partition(":")
+            if (validator := VALIDATORS.get(key)) is not None:
+                present += 1
+                checked += validator(value)
+        complete += present == len(VALIDATORS)
+        valid += checked == len(VALIDATORS)
+    return complete, valid
+
+
+def part1(counts: tuple[int, int]) -> int:
+    return counts[0]
+
+
+def part2(counts: tuple[int, int]) -> int:
+    return counts[1]
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        p1, p2 = count_valid(f)
+
+    print("Part 1:", p1)
+    print("Part 2:", p2)
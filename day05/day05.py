@@ -1,5 +1,8 @@
 import os.path
 from itertools import pairwise
+import numpy as np
+
+BITS = str.maketrans("FBLR", "0101")
 
 
 def halve(left: int, right: int, take_left: bool) -> tuple[int, int]:
@@ -23,20 +26,72 @@ def seat_id(boarding_pass: str) -> int:
     return row*8+col
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+# the pass is just the seat id in binary: B/R = 1, F/L = 0
+def seat_ids(data: str, mode: str = "translate") -> list[int]:
+    match mode:
+        case "translate":
+            return [int(bits, 2) for bits in data.translate(BITS).split()]
+        case "numpy":
+            return seat_ids_numpy(data).tolist()
+        case "bisect":
+            return [seat_id(row) for row in data.split()]
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+# whole file as a (passes, length+1) uint8 matrix, one matrix product for all ids
+def seat_ids_numpy(data: str) -> np.ndarray:
+    raw = data.encode().rstrip(b"\n")
+    if not raw:
+        return np.zeros(0, dtype=np.int64)
+    length = raw.index(b"\n") if b"\n" in raw else len(raw)
+    raw += b"\n"
+    if len(raw) % (length+1):
+        raise ValueError(f"Boarding passes must all have length {length}")
+    chars = np.frombuffer(raw, dtype=np.uint8).reshape(-1, length+1)[:, :length]
+    bits = (chars == ord("B")) | (chars == ord("R"))
+    return bits.astype(np.int64) @ (1 << np.arange(length-1, -1, -1))
+
+
+def parse(data: str) -> list[int]:
+    return seat_ids(data)
+
+
+def part1(all_seats: list[int]) -> int:
+    return max(all_seats)
+
+
+# bitmap of taken seats, the free one is the first gap after the lowest seat
+def part2(all_seats: list[int]) -> int:
+    low, high = min(all_seats), max(all_seats)
+    taken = bytearray(high+1)
+    for seat in all_seats:
+        taken[seat] = 1
+    free = taken.find(0, low)
+    if free == -1:
+        raise ValueError("No free seat found")
+    return free
+
+
+def part2_sorted(all_seats: list[int]) -> int:
+    for a, b in pairwise(sorted(all_seats)):
+        if b-a != 1:
+            return a+1
+    raise ValueError("No free seat found")
+
+
+def part2_gauss(all_seats: list[int]) -> int:
+    # little gauss
+    low, high = min(all_seats), max(all_seats)
+    return (high*(high+1) - low*(low-1))//2 - sum(all_seats)
 
-all_seats = sorted([seat_id(row) for row in data])
-low, high = all_seats[0], all_seats[-1]
-print("Part 1:",  high)
 
-# little gauss
-p2 = (high*(high+1) - low*(low-1))//2 - sum(all_seats)
-print("Part 2:", p2)
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        all_seats = parse(f.read())
 
-for a, b in pairwise(all_seats):
-    if b-a != 1:
-        print("Part 2:", a+1)
-        break
+    print("Part 1:", part1(all_seats))
+    print("Part 2:", part2_gauss(all_seats))
+    print("Part 2:", part2(all_seats))
@@ -1,16 +1,88 @@
 import os.path
-from collections import Counter
+from collections.abc import Iterable, Iterator
+import numpy as np
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+type Masks = tuple[int, int]  # (anyone answered yes, everyone answered yes) of a group
 
+ALL_QUESTIONS = (1 << 26) - 1
+BIT = {chr(ord("a")+i): 1 << i for i in range(26)}
 
-groups = data.split("\n\n")
-p1 = sum(len(set(group.replace("\n", ""))) for group in groups)
-print("Part 1:", p1)
 
-p2 = sum(sum(count == len(group.splitlines())
-         for count in Counter(group.replace("\n", "")).values()) for group in groups)
-print("Part 2:", p2)
+# question a..z -> bit 0..25
+def answer_mask(person: str) -> int:
+    mask = 0
+    for c in person:
+        mask |= BIT[c]
+    return mask
+
+
+# groups separated by blank lines, one pass and only the current group's masks in memory
+def group_masks(lines: Iterable[str]) -> Iterator[Masks]:
+    anyone, everyone, size = 0, ALL_QUESTIONS, 0
+    for line in lines:
+        if person := line.strip():
+            mask = answer_mask(person)
+            anyone |= mask
+            everyone &= mask
+            size += 1
+        elif size:
+            yield anyone, everyone
+            anyone, everyone, size = 0, ALL_QUESTIONS, 0
+    if size:
+        yield anyone, everyone
+
+
+def parse(data: str) -> list[Masks]:
+    return list(group_masks(data.splitlines()))
+
+
+# both parts streamed from any line source, i.e. an open file
+def count_answers(lines: Iterable[str]) -> tuple[int, int]:
+    part1 = part2 = 0
+    for anyone, everyone in group_masks(lines):
+        part1 += anyone.bit_count()
+        part2 += everyone.bit_count()
+    return part1, part2
+
+
+# bulk: masks of all persons from one scatter, OR/AND per group with reduceat
+def count_answers_numpy(data: str) -> tuple[int, int]:
+    text = np.frombuffer(data.encode("ascii"), dtype=np.uint8)
+    newline = text == ord("\n")
+    line = np.cumsum(newline) - newline  # line of every character
+    num_lines = int(line[-1]) + 1 if len(text) else 0
+
+    letters = (text >= ord("a")) & (text <= ord("z"))
+    persons = np.zeros(num_lines, dtype=np.uint32)
+    np.bitwise_or.at(persons, line[letters], np.left_shift(np.uint32(1), text[letters] - ord("a"), dtype=np.uint32))
+
+    # a blank line ends a group, persons of a group are consecutive lines
+    answered = np.zeros(num_lines, dtype=bool)
+    answered[line[letters]] = True
+    group = np.cumsum(~answered)[answered]
+    persons = persons[answered]
+    if len(persons) == 0:
+        return 0, 0
+    starts = np.flatnonzero(np.diff(group, prepend=-1))
+
+    anyone = np.bitwise_or.reduceat(persons, starts)
+    everyone = np.bitwise_and.reduceat(persons, starts)
+    return int(np.bitwise_count(anyone).sum()), int(np.bitwise_count(everyone).sum())
+
+
+def part1(groups: list[Masks]) -> int:
+    return sum(anyone.bit_count() for anyone, _ in groups)
+
+
+def part2(groups: list[Masks]) -> int:
+    return sum(everyone.bit_count() for _, everyone in groups)
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        groups = parse(f.read())
+
+    print("Part 1:", part1(groups))
+    print("Part 2:", part2(groups))
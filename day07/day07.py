@@ -1,5 +1,5 @@
 import os.path
-from functools import cache
+from collections import deque
 
 type Color = str
 type Rules = dict[str, list[tuple[int, str]]]
@@ -19,29 +19,75 @@ def create_rules(data: str) -> Rules:
     return rules
 
 
-@cache
-def valid(goal: Color, color: Color) -> bool:
-    global rules
-    if color == goal:
-        return True
-    return any(valid(goal, c) for num, c in rules[color])
+# built once per rule set, answers any number of queries
+class BagGraph:
+    def __init__(self, rules: Rules) -> None:
+        # forward: color -> contained (num, color), reverse: color -> colors directly containing it
+        self.contents: Rules = {color: list(values) for color, values in rules.items()}
+        for values in rules.values():
+            for _, c in values:
+                self.contents.setdefault(c, [])
+        self.containers: dict[Color, list[Color]] = {color: [] for color in self.contents}
+        for color, values in self.contents.items():
+            for _, c in values:
+                self.containers[c].append(color)
 
+        self.order = self.topological_order()
 
-@cache
-def required_bags(color: Color) -> int:
-    global rules
-    return sum(num + num*required_bags(c) for num, c in rules[color])
+        # bags inside every color, innermost colors first
+        self.required: dict[Color, int] = {}
+        for color in reversed(self.order):
+            self.required[color] = sum(num + num*self.required[c] for num, c in self.contents[color])
 
+    # https://en.wikipedia.org/wiki/Topological_sorting#Kahn's_algorithm
+    # outermost bags first
+    def topological_order(self) -> list[Color]:
+        indegree = {color: len(containers) for color, containers in self.containers.items()}
+        queue = deque(color for color, degree in indegree.items() if degree == 0)
+        order: list[Color] = []
+        while queue:
+            color = queue.popleft()
+            order.append(color)
+            for _, c in self.contents[color]:
+                indegree[c] -= 1
+                if indegree[c] == 0:
+                    queue.append(c)
+        if len(order) != len(self.contents):
+            raise ValueError("Rules contain a cycle")
+        return order
 
-def part1(rules: Rules, goal: Color) -> int:
-    return sum(valid(goal, color) for color in rules if color != goal)
+    # all colors that eventually contain goal, linear in the number of found colors and their edges
+    def can_contain(self, goal: Color) -> set[Color]:
+        seen: set[Color] = set()
+        queue = deque([goal])
+        while queue:
+            for color in self.containers[queue.popleft()]:
+                if color not in seen:
+                    seen.add(color)
+                    queue.append(color)
+        return seen
 
+    def required_bags(self, goal: Color) -> int:
+        return self.required[goal]
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
 
-rules: Rules = create_rules(data)
-print("Part 1:", part1(rules, "shiny gold"))
-print("Part 2:", required_bags("shiny gold"))
+def parse(data: str) -> BagGraph:
+    return BagGraph(create_rules(data))
+
+
+def part1(graph: BagGraph, goal: Color = "shiny gold") -> int:
+    return len(graph.can_contain(goal))
+
+
+def part2(graph: BagGraph, goal: Color = "shiny gold") -> int:
+    return graph.required_bags(goal)
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        graph = parse(f.read())
+
+    print("Part 1:", part1(graph))
+    print("Part 2:", part2(graph))
@@ -1,8 +1,11 @@
 import os.path
+from collections import deque
 
 type Instruction = tuple[str, int]
 type Program = list[Instruction]
 
+FLIP = {"jmp": "nop", "nop": "jmp"}
+
 
 def operate(instr: Instruction, acc: int, idx: int) -> tuple[int, int]:
     op, arg = instr
@@ -17,7 +20,12 @@ def operate(instr: Instruction, acc: int, idx: int) -> tuple[int, int]:
     return acc, idx
 
 
-def part1(program: Program, acc: int = 0, idx: int = 0) -> tuple[bool, int]:
+def parse(data: str) -> Program:
+    return [(line[:3], int(line[4:])) for line in data.splitlines()]
+
+
+# run until termination or loop: (terminated?, acc)
+def execute(program: Program, acc: int = 0, idx: int = 0) -> tuple[bool, int]:
     seen = set()
     while True:
         if idx in seen or idx > len(program):
@@ -28,35 +36,72 @@ def part1(program: Program, acc: int = 0, idx: int = 0) -> tuple[bool, int]:
         acc, idx = operate(program[idx], acc, idx)
 
 
-def part2(program: Program) -> int:
-    acc = idx = 0
-    seen = set()
-    while True:
-        if idx in seen or idx > len(program):
-            raise ValueError("Cant fix program.")
+def part1(program: Program) -> int:
+    _, acc = execute(program)
+    return acc
 
-        # fork on jmp or nop operations
-        op, arg = program[idx]
-        if op != "acc":
-            new_op = "jmp" if op == "nop" else "nop"
-            new_acc, new_idx = operate((new_op, arg), acc, idx)
-            success, new_acc = part1(program, new_acc, new_idx)
-            if success:
-                return new_acc
-
-        # continue execution
+
+def successor(instr: Instruction, idx: int) -> int:
+    op, arg = instr
+    return idx + arg if op == "jmp" else idx + 1
+
+
+# every instruction has exactly one successor, so the program is a functional graph
+# walking it backwards from len(program) finds all instructions that terminate in one pass
+def terminating(program: Program) -> list[bool]:
+    end = len(program)
+    predecessors: list[list[int]] = [[] for _ in range(end+1)]
+    for idx, instr in enumerate(program):
+        if 0 <= (nxt := successor(instr, idx)) <= end:
+            predecessors[nxt].append(idx)
+
+    reaches_end = [False] * (end+1)
+    reaches_end[end] = True
+    queue = deque([end])
+    while queue:
+        for idx in predecessors[queue.popleft()]:
+            reaches_end[idx] = True
+            queue.append(idx)
+    return reaches_end
+
+
+# the only instruction on the looping path whose flipped successor terminates
+# the path itself never terminates, so the fixed program never returns to the flip
+def find_repair(program: Program) -> int:
+    reaches_end = terminating(program)
+    if reaches_end[0]:
+        raise ValueError("Program terminates without repair.")
+    end = len(program)
+    idx = 0
+    seen = set()
+    while 0 <= idx < end and idx not in seen:
         seen.add(idx)
-        acc, idx = operate(program[idx], acc, idx)
+        op, arg = program[idx]
+        if op in FLIP and 0 <= (nxt := successor((FLIP[op], arg), idx)) <= end and reaches_end[nxt]:
+            return idx
+        idx = successor(program[idx], idx)
+    raise ValueError("Cant fix program.")
+
 
+def repair(program: Program) -> Program:
+    idx = find_repair(program)
+    op, arg = program[idx]
+    fixed = program.copy()
+    fixed[idx] = (FLIP[op], arg)
+    return fixed
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
 
-program: Program = [(line[:3], int(line[4:])) for line in data]
+def part2(program: Program) -> int:
+    terminated, acc = execute(repair(program))
+    assert terminated
+    return acc
+
 
-_, p1 = part1(program)
-print("Part 1:", p1)
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        program: Program = parse(f.read())
 
-print("Part 2:", part2(program))
+    print("Part 1:", part1(program))
+    print("Part 2:", part2(program))
@@ -1,27 +1,60 @@
 import os.path
 from timeit import default_timer as timer
+from collections import Counter, deque
+from collections.abc import Iterable
 
 
-def part1(numbers: list[int], preamble: int) -> tuple[int, int]:
+PREAMBLE = 25
 
-    def is_sum(idx: int) -> bool:
-        nonlocal preamble, numbers
-        seen: set[int] = set()
-        for j in range(idx-preamble, idx):
-            if numbers[idx] - numbers[j] in seen:
+
+def parse(data: str) -> list[int]:
+    return [int(line) for line in data.splitlines()]
+
+
+# the last size numbers, one insert and at most one remove per step
+class SlidingWindow:
+    __slots__ = ('size', 'values', 'counts')
+
+    def __init__(self, size: int) -> None:
+        self.size: int = size
+        self.values: deque[int] = deque()
+        self.counts: Counter[int] = Counter()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, num: int) -> None:
+        self.values.append(num)
+        self.counts[num] += 1
+        if len(self.values) > self.size:
+            old = self.values.popleft()
+            self.counts[old] -= 1
+            if self.counts[old] == 0:
+                del self.counts[old]
+
+    # sum of two numbers at different positions, equal values need two copies
+    def is_sum(self, target: int) -> bool:
+        counts = self.counts
+        for num, count in counts.items():
+            other = target - num
+            if other in counts and (other != num or count > 1):
                 return True
-            else:
-                seen.add(numbers[j])
         return False
 
-    for i in range(preamble, len(numbers)):
-        if not is_sum(i):
-            return i, numbers[i]
+
+# first number which is not the sum of two of the preamble before: (idx, num)
+# numbers can be any iterable, i.e. lines streamed from a file
+def find_weakness(numbers: Iterable[int], preamble: int) -> tuple[int, int]:
+    window = SlidingWindow(preamble)
+    for i, num in enumerate(numbers):
+        if len(window) == preamble and not window.is_sum(num):
+            return i, num
+        window.push(num)
 
     raise ValueError("No weakness found")
 
 
-def part2(numbers: list[int], target: int, target_idx: int) -> int:
+def find_contiguous(numbers: list[int], target: int, target_idx: int) -> int:
     # 2 pointer approch
     # first pass to find initial interval [idx_left,...,idx_right]
     idx_left = 0
@@ -60,20 +93,26 @@ def part2(numbers: list[int], target: int, target_idx: int) -> int:
     return region[0] + region[-1]
 
 
-s = timer()
+def part1(numbers: list[int]) -> int:
+    _, num = find_weakness(numbers, PREAMBLE)
+    return num
+
 
+def part2(numbers: list[int]) -> int:
+    idx, num = find_weakness(numbers, PREAMBLE)
+    return find_contiguous(numbers, num, idx)
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
 
-numbers = [int(line) for line in data.splitlines()]
+if __name__ == "__main__":
+    s = timer()
 
-idx, num = part1(numbers, 25)
-print("Part 1:", num)
-print("Part 2:", part2(numbers, num, idx))
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        numbers = parse(f.read())
 
+    print("Part 1:", part1(numbers))
+    print("Part 2:", part2(numbers))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
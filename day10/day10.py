@@ -1,42 +1,54 @@
 import os.path
 from timeit import default_timer as timer
-from collections import Counter
-from functools import cache
+from collections import Counter, deque
+from collections.abc import Iterable
 from itertools import pairwise
 
 
+def parse(data: str) -> list[int]:
+    joltages = sorted(int(line) for line in data.splitlines())
+    return [0] + joltages + [joltages[-1]+3]  # extend with outlet/inlet
+
+
 def part1(joltages: list[int]) -> int:
     # joltages must be sorted
     diffs = Counter(j2-j1 for j1, j2 in pairwise(joltages))
     return diffs[1] * diffs[3]
 
 
-def part2(joltages: list[int]) -> int:
-    # joltages must be sorted
-
-    @cache
-    def f(idx: int) -> int:
-        nonlocal joltages
-        if idx == len(joltages)-1:
-            return 1
-        return sum(f(j) for j in (idx+1, idx+2, idx+3) if j <= len(joltages)-1 and joltages[j]-joltages[idx] <= 3)
-
-    return f(0)
+# ways to reach each joltage, only the last 3 adapters can connect to the next one
+# joltages must be sorted and start with the outlet, any iterable works, i.e. a stream
+def count_arrangements(joltages: Iterable[int], modulus: int | None = None) -> int:
+    it = iter(joltages)
+    outlet = next(it, None)
+    if outlet is None:
+        raise ValueError("no joltages")
+    window: deque[tuple[int, int]] = deque([(outlet, 1)], maxlen=3)  # (joltage, ways)
+    for joltage in it:
+        if joltage < window[-1][0]:
+            raise ValueError(f"Joltages not sorted: {joltage} after {window[-1][0]}")
+        ways = sum(w for j, w in window if joltage - j <= 3)
+        if modulus is not None:
+            ways %= modulus
+        window.append((joltage, ways))
+    return window[-1][1]
 
 
-s = timer()
+def part2(joltages: list[int]) -> int:
+    # joltages must be sorted
+    return count_arrangements(joltages)
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+if __name__ == "__main__":
+    s = timer()
 
-joltages = sorted(int(line) for line in data.splitlines())
-joltages = [0] + joltages + [joltages[-1]+3]  # extend with outlet/inlet
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        joltages = parse(f.read())
 
-print("Part 1:", part1(joltages))
-print("Part 2:", part2(joltages))
+    print("Part 1:", part1(joltages))
+    print("Part 2:", part2(joltages))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
@@ -4,10 +4,17 @@ from timeit import default_timer as timer
 type Pos = tuple[int, int]  # (y,x)
 type Grid = dict[Pos, bool]  # { (y,x): occupied? }
 type Neighborhood = dict[Pos, list[Pos]]
+type Layout = tuple[Grid, int, int]  # (empty seats, dimy, dimx)
 
 DIRS8 = [(-1, -1), (-1, 0), (-1, 1), (0, 1), (0, -1), (1, -1), (1, 0), (1, 1)]
 
 
+def parse(data: str) -> Layout:
+    rows = data.splitlines()
+    empty: Grid = {(y, x): False for y, row in enumerate(rows) for x, c in enumerate(row) if c == "L"}
+    return empty, len(rows), len(rows[0])
+
+
 def add(x: Pos, y: Pos) -> Pos:
     return (x[0]+y[0], x[1]+y[1])
 
@@ -43,30 +50,68 @@ def sim(grid: Grid, neighborhood: Neighborhood, tolarance: int) -> Grid:
     return new_grid
 
 
-def equilibrium(grid: Grid, neighborhood: Neighborhood, tolarance: int) -> int:
+def equilibrium(grid: Grid, neighborhood: Neighborhood, tolarance: int, mode: str = "frontier") -> int:
+    match mode:
+        case "frontier":
+            return equilibrium_frontier(grid, neighborhood, tolarance)
+        case "full":
+            return equilibrium_full(grid, neighborhood, tolarance)
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+def equilibrium_full(grid: Grid, neighborhood: Neighborhood, tolarance: int) -> int:
     while grid != (grid := sim(grid, neighborhood, tolarance)):
         pass
     return sum(grid.values())
 
 
-s = timer()
+# only seats next to a flipped seat can flip in the next generation
+# occupied neighbor counts are updated incrementally, equilibrium <=> frontier is empty
+# seats are numbered to work on flat lists instead of position dicts
+def equilibrium_frontier(grid: Grid, neighborhood: Neighborhood, tolarance: int) -> int:
+    seats = list(grid)
+    seat_idx = {pos: i for i, pos in enumerate(seats)}
+    neighbors = [[seat_idx[n] for n in neighborhood[pos]] for pos in seats]
+    state = [grid[pos] for pos in seats]
+    occupied = [sum(state[n] for n in seat_neighbors) for seat_neighbors in neighbors]
+
+    frontier: set[int] | range = range(len(seats))
+    while frontier:
+        flipped = [i for i in frontier if state[i] != (occupied[i] < tolarance if state[i] else occupied[i] == 0)]
+        frontier = set(flipped)
+        for i in flipped:
+            state[i] = not state[i]
+            delta = 1 if state[i] else -1
+            for n in neighbors[i]:
+                occupied[n] += delta
+            frontier.update(neighbors[i])
+
+    return sum(state)
+
+
+def part1(layout: Layout) -> int:
+    empty, dimy, dimx = layout
+    neighborhood = precompute_neighborhood(empty, dimy, dimx)
+    return equilibrium(empty, neighborhood, 4)
+
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+def part2(layout: Layout) -> int:
+    empty, dimy, dimx = layout
+    neighborhood = precompute_neighborhood(empty, dimy, dimx, part2=True)
+    return equilibrium(empty, neighborhood, 5)
 
 
-empty: Grid = {(y, x): False for y, row in enumerate(data) for x, c in enumerate(row) if c == "L"}
-dimy, dimx = len(data), len(data[0])
+if __name__ == "__main__":
+    s = timer()
 
-neighborhood_p1 = precompute_neighborhood(empty, dimy, dimx)
-p1 = equilibrium(empty, neighborhood_p1, 4)
-print("Part 1:", p1)
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        layout = parse(f.read())
 
-neighborhood_p2 = precompute_neighborhood(empty, dimy, dimx, part2=True)
-p2 = equilibrium(empty, neighborhood_p2, 5)
-print("Part 2:", p2)
+    print("Part 1:", part1(layout))
+    print("Part 2:", part2(layout))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
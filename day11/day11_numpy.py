@@ -13,7 +13,14 @@ type Grid = np.ndarray
 DIRS8 = [(-1, -1), (-1, 0), (-1, 1), (0, 1), (0, -1), (1, -1), (1, 0), (1, 1)]
 
 
+def parse(data: str) -> Grid:
+    # 0 = no seat, 1 = empty, 2 = occupied
+    converter = str.maketrans('.L#', '012')
+    return np.array([[int(x) for x in row.translate(converter)] for row in data.splitlines()])
+
+
 def part1(grid: Grid) -> int:
+    grid = grid.copy()
     kernel = np.ones((3, 3), dtype=int)
     kernel[1, 1] = 0
 
@@ -31,6 +38,8 @@ def part1(grid: Grid) -> int:
 
 
 def part2(grid: Grid) -> int:
+    grid = grid.copy()
+
     def closest_seat_coord(coord, offset):
         curr_loc = (coord[0] + offset[0], coord[1] + offset[1])
         while 0 <= curr_loc[0] < len(grid) and 0 <= curr_loc[1] < len(grid[curr_loc[0]]) and grid[curr_loc] == 0:
@@ -56,18 +65,16 @@ def part2(grid: Grid) -> int:
     return (grid == 2).sum()
 
 
-s = timer()
+if __name__ == "__main__":
+    s = timer()
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        grid: Grid = parse(f.read())
 
-# 0 = no seat, 1 = empty, 2 = occupied
-converter = str.maketrans('.L#', '012')
-grid: Grid = np.array([[int(x) for x in row.translate(converter)] for row in data])
-print("Part 1:", part1(grid.copy()))
-print("Part 2:", part2(grid))
+    print("Part 1:", part1(grid))
+    print("Part 2:", part2(grid))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
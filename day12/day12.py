@@ -18,6 +18,10 @@ ROTATIONS: dict[int, Dir] = {
 }
 
 
+def parse(data: str) -> list[str]:
+    return data.splitlines()
+
+
 def part1(instr: list[str]) -> int:
     global DIRS, ROTATIONS
     pos = 0
@@ -54,15 +58,16 @@ def part2(instr: list[str]) -> int:
     return int(abs(ship_pos.real) + abs(ship_pos.imag))
 
 
-s = timer()
+if __name__ == "__main__":
+    s = timer()
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        instr = parse(f.read())
 
-print("Part 1:", part1(data))
-print("Part 2:", part2(data))
+    print("Part 1:", part1(instr))
+    print("Part 2:", part2(instr))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
@@ -1,7 +1,14 @@
 import os.path
+import sys
 from timeit import default_timer as timer
-from math import prod
-from z3 import Optimize, Int
+from math import prod, gcd
+from collections.abc import Iterable
+
+type Congruence = tuple[int, int]  # x = remainder (mod modulus)
+
+
+def parse(data: str) -> list[str]:
+    return data.splitlines()
 
 
 def part1(data: list[str]) -> int:
@@ -11,7 +18,20 @@ def part1(data: list[str]) -> int:
     return prod(res[0])
 
 
-def part2(data: list[str]) -> int:
+def part2(data: list[str], mode: str = "crt") -> int:
+    match mode:
+        case "crt":
+            return earliest_timestamp(data[1])
+        case "z3":
+            return part2_z3(data)
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+# verification only, z3 is imported on demand
+def part2_z3(data: list[str]) -> int:
+    from z3 import Optimize, Int
+
     # "simple" Integer Linear Programming
     # scipy optimize would also do, but z3 doesnt need matrices..
     solver = Optimize()
@@ -30,48 +50,49 @@ def part2(data: list[str]) -> int:
 
 
 # CRT: https://en.wikipedia.org/wiki/Chinese_remainder_theorem
-# https://www.geeksforgeeks.org/dsa/chinese-remainder-theorem-in-python/
-def part2_crt(data: list[str]) -> int:
-
-    def gcd_extended(a: int, b: int) -> tuple[int, int, int]:
-        if a == 0:
-            return b, 0, 1
-        gcd, x1, y1 = gcd_extended(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
-        return gcd, x, y
-
-    def find_min_x(num: list[int], rem: list[int]) -> int:
-        N = prod(num)
-        result = 0
-        for i in range(len(num)):
-            prod_i = N // num[i]
-            _, inv_i, _ = gcd_extended(prod_i, num[i])
-            result += rem[i] * prod_i * inv_i
-
-        return result % N
-
-    num, rem = [], []
-    for i, bus_id in enumerate(data[1].split(",")):
-        if bus_id == "x":
-            continue
-        num.append(int(bus_id))
-        rem.append(-i)
+# generalized to moduli that are not pairwise coprime, congruences are merged one by one
+def crt(congruences: Iterable[Congruence]) -> Congruence:
+    rem, mod = 0, 1
+    for r, m in congruences:
+        g = gcd(mod, m)
+        if (r - rem) % g:
+            raise ValueError(f"No solution: x = {rem} (mod {mod}) contradicts x = {r} (mod {m})")
+        # rem + k*mod = r (mod m)  <=>  k = (r-rem)/g * (mod/g)^-1 (mod m/g)
+        k = (r - rem) // g * pow(mod // g, -1, m // g) % (m // g)
+        rem += k * mod
+        mod = mod // g * m
+        rem %= mod
+    return rem, mod
+
+
+# bus i departs i minutes after t: t = -i (mod bus_id)
+def bus_congruences(schedule: str) -> list[Congruence]:
+    return [(-i, int(bus_id)) for i, bus_id in enumerate(schedule.split(",")) if bus_id != "x"]
+
+
+# smallest positive timestamp
+def earliest_timestamp(schedule: str) -> int:
+    rem, mod = crt(bus_congruences(schedule))
+    return rem or mod
 
-    return find_min_x(num, rem)
 
+def earliest_timestamps(schedules: Iterable[str]) -> list[int]:
+    return [earliest_timestamp(schedule) for schedule in schedules]
 
-s = timer()
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+if __name__ == "__main__":
+    s = timer()
 
-print("Part 1:", part1(data))
-print("Part 2:", part2(data))
-print("Part 2 (CRT):", part2_crt(data))
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = parse(f.read())
 
+    print("Part 1:", part1(data))
+    print("Part 2:", part2(data))
+    # cross check with the z3 model only on request: python day13/day13.py --z3
+    if "--z3" in sys.argv[1:]:
+        print("Part 2 (z3):", part2(data, "z3"))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
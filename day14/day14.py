@@ -1,6 +1,12 @@
 import os.path
 from timeit import default_timer as timer
 
+type Pattern = tuple[int, int]  # (address with floating bits cleared, floating bits)
+
+
+def parse(data: str) -> list[str]:
+    return data.splitlines()
+
 
 def part1(data: list[str]) -> int:
     mask_0, mask_1 = 0, 0
@@ -18,7 +24,18 @@ def part1(data: list[str]) -> int:
     return sum(mem.values())
 
 
-def part2(data: list[str]) -> int:
+def part2(data: list[str], mode: str = "patterns") -> int:
+    match mode:
+        case "patterns":
+            return part2_patterns(data)
+        case "expand":
+            return part2_expand(data)
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+# writes every concrete address, 2^k addresses for k floating bits
+def part2_expand(data: list[str]) -> int:
     mask_1 = 0
     mask_floating = []
     mem: dict[int, int] = {}
@@ -46,16 +63,55 @@ def part2(data: list[str]) -> int:
     return sum(mem.values())
 
 
-s = timer()
+# pattern minus pattern as disjoint patterns, at most one per bit that is floating in a but fixed in b
+def subtract(a: Pattern, b: Pattern) -> list[Pattern]:
+    address_a, floating_a = a
+    address_b, floating_b = b
+    fixed_both = ~floating_a & ~floating_b
+    if (address_a ^ address_b) & fixed_both:
+        return [a]  # disjoint
+
+    rest: list[Pattern] = []
+    split = floating_a & ~floating_b
+    while split:
+        bit = split & -split
+        split ^= bit
+        floating_a ^= bit
+        # part of a that differs from b in this bit, earlier split bits agree with b
+        rest.append((address_a | (~address_b & bit), floating_a))
+        address_a |= address_b & bit
+    return rest
+
+
+# memory holds disjoint address patterns, a new write is cut out of all older ones
+def part2_patterns(data: list[str]) -> int:
+    mask_1, mask_floating = 0, 0
+    mem: list[tuple[Pattern, int]] = []
+
+    for line in data:
+        op, value = line.split(" = ")
+        if op == "mask":
+            mask_1 = int(value.replace("X", "0"), 2)
+            mask_floating = int(value.replace("1", "0").replace("X", "1"), 2)
+        else:
+            address, val = int(op[4:-1]), int(value)
+            write = ((address | mask_1) & ~mask_floating, mask_floating)
+            mem = [(rest, v) for pattern, v in mem for rest in subtract(pattern, write)]
+            mem.append((write, val))
+
+    return sum(v << floating.bit_count() for (_, floating), v in mem)
+
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+if __name__ == "__main__":
+    s = timer()
 
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = parse(f.read())
 
-print("Part 1:", part1(data))
-print("Part 2:", part2(data))
+    print("Part 1:", part1(data))
+    print("Part 2:", part2(data))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
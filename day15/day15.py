@@ -1,13 +1,30 @@
 import os.path
 from timeit import default_timer as timer
+from array import array
 
 
-def memory_game(numbers: list[int], num_turns: int) -> int:
+def parse(data: str) -> list[int]:
+    return [int(c) for c in data.split(",")]
+
+
+def memory_game(numbers: list[int], num_turns: int, mode: str = "array") -> int:
 
     assert (num_turns > 0), "Number of turns must be positive"
+    match mode:
+        case "array":
+            engine = memory_game_array
+        case "dict":
+            engine = memory_game_dict
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
     if num_turns <= len(numbers):
         return numbers[num_turns-1]
+    return engine(numbers, num_turns)
+
 
+# reference implementation
+def memory_game_dict(numbers: list[int], num_turns: int) -> int:
     memory: dict[int, int] = {n: i for i, n in enumerate(numbers, 1)}
     last_spoken = numbers[-1]
     for turn in range(len(numbers), num_turns):
@@ -23,16 +40,41 @@ def memory_game(numbers: list[int], num_turns: int) -> int:
     return last_spoken
 
 
-s = timer()
+# every spoken number is a difference of two turns, so it is below num_turns
+# -> flat table indexed by number, 4 bytes per slot, 0 = never spoken (turns start at 1)
+def memory_game_array(numbers: list[int], num_turns: int) -> int:
+    assert (num_turns < 2**32), "Turns must fit into 4 bytes"
+    memory = array("I", bytes(4 * max(num_turns, max(numbers)+1)))
+    for i, n in enumerate(numbers, 1):
+        memory[n] = i
+
+    last_spoken = numbers[-1]
+    for turn in range(len(numbers), num_turns):
+        seen = memory[last_spoken]
+        memory[last_spoken] = turn
+        last_spoken = turn - seen if seen else 0
+
+    return last_spoken
+
+
+def part1(numbers: list[int]) -> int:
+    return memory_game(numbers, 2020)
+
+
+def part2(numbers: list[int]) -> int:
+    return memory_game(numbers, 30_000_000)
+
+
+if __name__ == "__main__":
+    s = timer()
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        numbers = parse(f.read())
 
-numbers = [int(c) for c in data.split(",")]
-print("Part 1:", memory_game(numbers, 2020))
-print("Part 2:", memory_game(numbers, 30_000_000))
+    print("Part 1:", part1(numbers))
+    print("Part 2:", part2(numbers))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
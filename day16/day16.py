@@ -1,5 +1,11 @@
 import os.path
 from timeit import default_timer as timer
+from bisect import bisect_right
+import numpy as np
+
+
+type Notes = tuple[list[range], str, str]  # (ranges, my ticket, nearby tickets)
+type IntervalIndex = tuple[list[int], list[int]]  # (starts, stops) of ordered disjoint ranges
 
 
 # return ordered union of ranges r1 and r2
@@ -57,7 +63,40 @@ def create_ranges(data: str) -> list[range]:
     return ranges
 
 
-def error_rate(ranges: list[range], data: str) -> int:
+def parse(data: str) -> Notes:
+    valid, my_ticket, nearby = data.split("\n\n")
+    return create_ranges(valid), my_ticket, nearby
+
+
+def create_index(ranges: list[range]) -> IntervalIndex:
+    return [r.start for r in ranges], [r.stop for r in ranges]
+
+
+# the only range that can contain num is the last one starting at or before it
+def is_valid(index: IntervalIndex, num: int) -> bool:
+    starts, stops = index
+    idx = bisect_right(starts, num) - 1
+    return idx >= 0 and num < stops[idx]
+
+
+def ticket_values(data: str) -> np.ndarray:
+    values = data.partition("\n")[2]  # skip the header
+    return np.fromstring(values.replace("\n", ","), dtype=np.int64, sep=",")
+
+
+def error_rate(ranges: list[range], data: str, mode: str = "numpy") -> int:
+    match mode:
+        case "numpy":
+            return error_rate_numpy(ranges, data)
+        case "bisect":
+            return error_rate_bisect(ranges, data)
+        case "linear":
+            return error_rate_linear(ranges, data)
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+def error_rate_linear(ranges: list[range], data: str) -> int:
     res = 0
     for line in data.splitlines()[1:]:
         for num in map(int, line.split(",")):
@@ -68,18 +107,41 @@ def error_rate(ranges: list[range], data: str) -> int:
     return res
 
 
-s = timer()
+def error_rate_bisect(ranges: list[range], data: str) -> int:
+    index = create_index(ranges)
+    res = 0
+    for line in data.splitlines()[1:]:
+        for num in map(int, line.split(",")):
+            if not is_valid(index, num):
+                res += num
+    return res
+
+
+# all values at once: one searchsorted and one comparison over the whole array
+def error_rate_numpy(ranges: list[range], data: str) -> int:
+    starts, stops = map(np.array, create_index(ranges))
+    values = ticket_values(data)
+    if len(starts) == 0:
+        return int(values.sum())
+    idx = np.searchsorted(starts, values, side="right") - 1
+    valid = (idx >= 0) & (values < stops[np.maximum(idx, 0)])
+    return int(values[~valid].sum())
+
+
+def part1(notes: Notes) -> int:
+    ranges, _, nearby = notes
+    return error_rate(ranges, nearby)
+
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+if __name__ == "__main__":
+    s = timer()
 
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        notes = parse(f.read())
 
-valid, my_ticket, nearby = data.split("\n\n")
-ranges = create_ranges(valid)
-p1 = error_rate(ranges, nearby)
-print("Part 1:", p1)
+    print("Part 1:", part1(notes))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
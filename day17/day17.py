@@ -1,10 +1,32 @@
 import os.path
 from timeit import default_timer as timer
+from collections import Counter
+from functools import cache
+from itertools import product
+from math import factorial
 import numpy as np
 from scipy.ndimage import convolve
 
+type Cell = tuple[int, ...]  # (y, x, *extra) with 0 <= extra[0] <= extra[1] <= ...
 
-def solve(grid: np.ndarray, N: int, cycles: int) -> int:
+
+def parse(data: str) -> np.ndarray:
+    # convert input to 2D grid
+    converter = str.maketrans('.#', '01')
+    return np.array([[int(x) for x in row.translate(converter)] for row in data.splitlines()])
+
+
+def solve(grid: np.ndarray, N: int, cycles: int, mode: str = "sparse") -> int:
+    match mode:
+        case "sparse":
+            return conway_sparse(grid, N, cycles)
+        case "dense":
+            return solve_dense(grid, N, cycles)
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+def solve_dense(grid: np.ndarray, N: int, cycles: int) -> int:
     # make the grid N dimensional
     for _ in range(N-2):
         grid = np.expand_dims(grid, -1)
@@ -37,21 +59,64 @@ def conway(grid: np.ndarray, kernel: np.ndarray, cycles: int) -> int:
     return grid.sum()
 
 
-s = timer()
+# the extra dimensions start as a single slice at 0 and the rules dont prefer a direction
+# -> every state is symmetric under mirroring (z -> -z) and swapping of the extra axes
+# only store the canonical representative: extra coords mirrored to >= 0 and sorted
+@cache
+def orbit_size(extra: Cell) -> int:
+    # cells represented by a canonical cell
+    size = 2**sum(1 for e in extra if e) * factorial(len(extra))
+    for count in Counter(extra).values():
+        size //= factorial(count)
+    return size
+
+
+def conway_sparse(grid: np.ndarray, N: int, cycles: int) -> int:
+    zero = (0,)*(N-2)
+    active: set[Cell] = {(int(y), int(x)) + zero for y, x in zip(*np.nonzero(grid))}
+    offsets_yx = list(product((-1, 0, 1), repeat=2))
+    offsets_extra = list(product((-1, 0, 1), repeat=N-2))
+
+    for _ in range(cycles):
+        # every active cell a stands for orbit_size(a) cells
+        # a neighbor n of a with canonical form p receives orbit_size(a),
+        # then (sum of received weights) / orbit_size(p) = active neighbors of p
+        weights: Counter[Cell] = Counter()
+        for cell in active:
+            y, x, extra = cell[0], cell[1], cell[2:]
+            weight = orbit_size(extra)
+            for d_extra in offsets_extra:
+                n_extra = tuple(sorted(abs(e+d) for e, d in zip(extra, d_extra)))
+                is_self = not any(d_extra)
+                for dy, dx in offsets_yx:
+                    if is_self and dy == dx == 0:
+                        continue
+                    weights[(y+dy, x+dx) + n_extra] += weight
+
+        active = {cell for cell, weight in weights.items()
+                  if (num := weight // orbit_size(cell[2:])) == 3 or (num == 2 and cell in active)}
+
+    return sum(orbit_size(cell[2:]) for cell in active)
+
+
+def part1(grid: np.ndarray) -> int:
+    return int(solve(grid, 3, 6))
+
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+def part2(grid: np.ndarray) -> int:
+    return int(solve(grid, 4, 6))
 
 
-# convert input to 2D grid
-converter = str.maketrans('.#', '01')
-grid = np.array([[int(x) for x in row.translate(converter)] for row in data])
+if __name__ == "__main__":
+    s = timer()
 
-print("Part 1:", solve(grid, 3, 6))
-print("Part 2:", solve(grid, 4, 6))
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        grid = parse(f.read())
 
+    print("Part 1:", part1(grid))
+    print("Part 2:", part2(grid))
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
@@ -1,56 +1,106 @@
 import os.path
 from timeit import default_timer as timer
 from operator import add, mul
+import re
+
+type Token = int | str
+type Precedence = dict[str, int]  # higher binds tighter, equal is evaluated left to right
 
 OP = {"+": add, "*": mul}
+SAME_PRECEDENCE: Precedence = {"+": 1, "*": 1}
+ADDITION_FIRST: Precedence = {"+": 2, "*": 1}
+
+TOKEN = re.compile(r"\d+|\S")
+
+
+def tokenize(line: str) -> list[Token]:
+    tokens: list[Token] = []
+    for token in TOKEN.findall(line):
+        if token.isdigit():
+            tokens.append(int(token))
+        elif token in OP or token in "()":
+            tokens.append(token)
+        else:
+            raise ValueError(f"Unexpected token {token!r} in {line!r}")
+    return tokens
+
+
+def parse(data: str) -> list[list[Token]]:
+    return [tokenize(line) for line in data.splitlines() if line.strip()]
+
+
+# https://en.wikipedia.org/wiki/Operator-precedence_parser
+# iterative with an operand and an operator stack, every token is pushed and popped once
+# operands and operators must alternate, which rules out every malformed expression up front
+def evaluate(tokens: list[Token], precedence: Precedence) -> int:
+    operands: list[int] = []
+    operators: list[str] = []
+    expect_operand = True
+
+    def reduce() -> None:
+        right, left = operands.pop(), operands.pop()
+        operands.append(OP[operators.pop()](left, right))
+
+    def malformed() -> ValueError:
+        return ValueError(f"Malformed expression {tokens}")
+
+    for token in tokens:
+        if isinstance(token, int):
+            if not expect_operand:
+                raise malformed()
+            operands.append(token)
+            expect_operand = False
+        elif token == "(":
+            if not expect_operand:
+                raise malformed()
+            operators.append(token)
+        elif token == ")":
+            if expect_operand:
+                raise malformed()
+            while operators and operators[-1] != "(":
+                reduce()
+            if not operators:  # unbalanced ")"
+                raise malformed()
+            operators.pop()
+        else:
+            if expect_operand:
+                raise malformed()
+            # left associative: reduce everything binding at least as tight
+            while operators and operators[-1] != "(" and precedence[operators[-1]] >= precedence[token]:
+                reduce()
+            operators.append(token)
+            expect_operand = True
+
+    if expect_operand or "(" in operators:  # empty, trailing operator or unbalanced "("
+        raise malformed()
+    while operators:
+        reduce()
+
+    return operands[0]
+
+
+def homework(expressions: list[list[Token]], precedence: Precedence) -> int:
+    return sum(evaluate(tokens, precedence) for tokens in expressions)
+
+
+def part1(expressions: list[list[Token]]) -> int:
+    return homework(expressions, SAME_PRECEDENCE)
+
+
+def part2(expressions: list[list[Token]]) -> int:
+    return homework(expressions, ADDITION_FIRST)
+
+
+if __name__ == "__main__":
+    s = timer()
+
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        expressions = parse(f.read())
 
+    print("Part 1:", part1(expressions))
+    print("Part 2:", part2(expressions))
 
-def homework(data: list[str]) -> int:
-    stack = []
-
-    def evaluate(expr: str) -> int:
-        nonlocal stack
-        if expr.isdigit():
-            return int(expr)
-        elif expr[0] in "+*":
-            return OP[expr[0]](stack.pop(), evaluate(expr[1:]))
-        elif expr[0].isdigit():
-            idx = 0
-            while expr[idx].isdigit():
-                idx += 1
-            stack.append(int(expr[:idx]))
-            return evaluate(expr[idx:])
-        else:  # brackets
-            bracket = expr[0]
-            opposite = ")" if bracket == "(" else "("
-            idx = 1
-            count = 1
-            while count != 0:
-                if expr[idx] == opposite:
-                    count -= 1
-                elif expr[idx] == bracket:
-                    count += 1
-                idx += 1
-            return evaluate(str(evaluate(expr[1:idx-1])) + expr[idx:])
-
-    res = 0
-    for line in data:
-        line = line.replace(" ", "")
-        ee = evaluate(line[::-1])
-        res += ee
-    return res
-
-
-
-s = timer()
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
-
-print("Part 1:", homework(data))
-
-
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
@@ -10,44 +10,67 @@ from scipy.ndimage import convolve
 type Pos = complex  # y = 1j downwards
 type Dir = complex
 type Grid = dict[Pos, Tile | None]
-type Edge = np.ndarray
-type EdgeTuple = tuple[int, ...]
+type Edge = int  # bits read left to right (N,S) or top to bottom (E,W)
+type Edges = tuple[Edge, Edge, Edge, Edge]  # (N,E,S,W)
 
 DIRS: dict[str, Dir] = {"N": -1j, "E": 1, "S": 1j, "W": -1}
+SIDES: list[Dir] = [DIRS["N"], DIRS["E"], DIRS["S"], DIRS["W"]]  # index into Edges
+
+
+# python int, so edges of any length fit (the stitched image is 96 wide)
+def edge_code(edge: np.ndarray) -> Edge:
+    return int("".join(map(str, edge)), 2)
+
+
+# https://en.wikipedia.org/wiki/Dihedral_group_of_order_8
+# edges of all 8 orientations, in the same order as Tile.transform yields them
+# rot90 (counter clockwise): (N,E,S,W) -> (E, rev S, W, rev N)
+# fliplr:                    (N,E,S,W) -> (rev N, W, rev S, E)
+def orientation_table(matrix: np.ndarray) -> list[Edges]:
+    # (edge, reversed edge) per side
+    N, E, S, W = ((edge_code(edge), edge_code(edge[::-1]))
+                  for edge in (matrix[0, :], matrix[:, -1], matrix[-1, :], matrix[:, 0]))
+    table = []
+    for _ in range(2):
+        for _ in range(4):
+            table.append((N[0], E[0], S[0], W[0]))
+            N, E, S, W = E, S[::-1], W, N[::-1]
+        N, E, S, W = N[::-1], W, S[::-1], E
+    return table
 
 
 class Tile:
     def __init__(self, idx: int, matrix: np.ndarray) -> None:
         self.idx = idx
         self.matrix = matrix
+        self.original = matrix
+        self.orientations = orientation_table(matrix)
+        # (side, edge) -> orientations, a palindromic edge shows up in two of them
+        self.orientation_lookup: defaultdict[tuple[Dir, Edge], list[int]] = defaultdict(list)
+        for k, edges in enumerate(self.orientations):
+            for i, d in enumerate(SIDES):
+                self.orientation_lookup[(d, edges[i])].append(k)
+        self.orientation = 0
 
     # https://en.wikipedia.org/wiki/Dihedral_group_of_order_8
+    # walks all 8 orientations via orient, so matrix and edge table stay in sync
     def transform(self) -> Iterator[None]:
-        for _ in range(2):
-            for _ in range(4):
-                yield None
-                self.matrix = np.rot90(self.matrix)
-            self.matrix = np.fliplr(self.matrix)
+        for k in range(8):
+            self.orient(k)
+            yield None
 
-    # get specific edge
-    def get_edge(self, d: Dir) -> Edge:
-        match d:
-            case -1j: return self.matrix[0, :]   # N
-            case   1: return self.matrix[:, -1]  # E
-            case  1j: return self.matrix[-1, :]  # S
-            case -1: return self.matrix[:, 0]    # W
-        raise ValueError(f"Direction {d} not defined")
+    # k < 4: rotated k times, k >= 4: flipped, then rotated k-4 times
+    def orient(self, k: int) -> None:
+        self.orientation = k
+        self.matrix = np.rot90(self.original if k < 4 else np.fliplr(self.original), k % 4)
 
-    # [north_edge,west_edge]
-    def get_north_and_west_edges(self) -> tuple[Edge, Edge]:
-        return (self.get_edge(DIRS["N"]), self.get_edge(DIRS["W"]))
+    # get specific edge of the current orientation
+    def get_edge(self, d: Dir) -> Edge:
+        return self.orientations[self.orientation][SIDES.index(d)]
 
     # all 8 different edges with respect to rotations/flips
-    def all_symmetry_edges(self) -> Iterator[Edge]:
-        for d in ((0, ...), (..., 0), (-1, ...), (..., -1)):
-            edge = self.matrix[d]
-            yield edge
-            yield np.flipud(edge)
+    def all_symmetry_edges(self) -> set[Edge]:
+        return set().union(*self.orientations)
 
 
 def create_tiles(data: str) -> list[Tile]:
@@ -62,16 +85,21 @@ def create_tiles(data: str) -> list[Tile]:
     return tiles
 
 
+# the jigsaw is assembled once, both parts read from the stitched grid
+def parse(data: str) -> tuple[Grid, int]:
+    return create_grid(create_tiles(data))
+
+
 def create_grid(tiles: list[Tile]) -> tuple[Grid, int]:
     # collect all possible edges
-    edges_to_tiles: defaultdict[EdgeTuple, set[Tile]] = defaultdict(set)
+    edges_to_tiles: defaultdict[Edge, set[Tile]] = defaultdict(set)
     for tile in tiles:
         for edge in tile.all_symmetry_edges():
-            edges_to_tiles[tuple(edge)].add(tile)
+            edges_to_tiles[edge].add(tile)
 
     # find edge and corner tiles
     # "..., but the outermost edges won't line up with any other tiles"
-    edge_tiles: Counter[Tile] = Counter(tiles.pop() for tiles in edges_to_tiles.values() if len(tiles) == 1)
+    edge_tiles: Counter[Tile] = Counter(next(iter(tiles)) for tiles in edges_to_tiles.values() if len(tiles) == 1)
     corner_tiles: list[Tile] = [tile for tile, count in edge_tiles.items() if count == 4]
     assert len(corner_tiles) == 4, f"Found {len(corner_tiles)} corner tiles, expected 4."
     p1 = prod(tile.idx for tile in corner_tiles)
@@ -86,9 +114,9 @@ def create_grid(tiles: list[Tile]) -> tuple[Grid, int]:
     grid[0] = top_left_corner
 
     # find correct orientation for the top left corner
-    for _ in top_left_corner.transform():
-        north_and_west_edges = top_left_corner.get_north_and_west_edges()
-        if all(len(edges_to_tiles[tuple(e)]) == 0 for e in north_and_west_edges):  # got popped above
+    for k, (north, _, _, west) in enumerate(top_left_corner.orientations):
+        if len(edges_to_tiles[north]) == 1 and len(edges_to_tiles[west]) == 1:
+            top_left_corner.orient(k)
             break
     else:
         raise ValueError("Aligning top left corner failed.")
@@ -103,29 +131,37 @@ def create_grid(tiles: list[Tile]) -> tuple[Grid, int]:
 
         # must share edge with north and/or west neighbor
         # those neighbors are already correcly orientated
+        # without such a neighbor that side has to be an outermost edge
         shared_edges: list[tuple[Edge, Dir]] = []
+        border_sides: list[Dir] = []
         neighbors: set[Tile] = set()
         for d in (DIRS["N"], DIRS["W"]):
             if (neighbor := grid.get(pos+d, None)):
                 shared_edge = neighbor.get_edge(-d)  # -d cuz mirrored
                 shared_edges.append((shared_edge, d))
                 neighbors.add(neighbor)
+            else:
+                border_sides.append(d)
 
         candidates: set[Tile] = set()
         for edge, _ in shared_edges:
-            candidates.update(edges_to_tiles[tuple(edge)])
+            candidates.update(edges_to_tiles[edge])
         candidates.difference_update(neighbors)
 
         # only one candidate should be left
         assert len(candidates) == 1, f"No Tile found for position {pos}"
         tile = candidates.pop()
 
-        # find correct transformation
-        for _ in tile.transform():
-            if all((shared_edge == tile.get_edge(d)).all() for shared_edge, d in shared_edges):
+        # find correct transformation, the first one matching every shared and outermost edge
+        edge, d = shared_edges[0]
+        for k in tile.orientation_lookup.get((d, edge), []):
+            edges = tile.orientations[k]
+            if (all(edges[SIDES.index(d)] == edge for edge, d in shared_edges)
+                    and all(len(edges_to_tiles[edges[SIDES.index(d)]]) == 1 for d in border_sides)):
+                tile.orient(k)
                 break
         else:
-            raise ValueError(f"Aligning tile {grid[pos]} in position {pos} failed.")
+            raise ValueError(f"Aligning tile {tile.idx} in position {pos} failed.")
 
         grid[pos] = tile
 
@@ -171,23 +207,31 @@ def plot_tile(tile: Tile) -> None:
     plt.show()
 
 
-s = timer()
+def part1(assembly: tuple[Grid, int]) -> int:
+    _, p1 = assembly
+    return p1
+
+
+def part2(assembly: tuple[Grid, int]) -> int:
+    grid, _ = assembly
+    return int(find_sea_monsters(create_image(grid)))
+
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+if __name__ == "__main__":
+    s = timer()
 
-tiles = create_tiles(data)
-grid, p1 = create_grid(tiles)
-print("Part 1:", p1)
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        grid, p1 = parse(f.read())
 
-image = create_image(grid)
-p2 = find_sea_monsters(image)
-print("Part 2:", p2)
+    print("Part 1:", p1)
 
+    image = create_image(grid)
+    p2 = find_sea_monsters(image)
+    print("Part 2:", p2)
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
 
-plot_tile(image)
+    plot_tile(image)
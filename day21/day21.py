@@ -1,14 +1,20 @@
 import os.path
+import sys
 from timeit import default_timer as timer
 from collections import Counter
 
+# run as a plain script: the shared aoc package lives in the repository root
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from aoc.matching import hopcroft_karp, is_unique
+
 type Ingredient = str  # i.e. mxmxvkd
 type Allergen = str  # i.e. dairy
+type Notes = tuple[dict[Allergen, set[Ingredient]], Counter[Ingredient]]
 
 
-# could be done with https://en.wikipedia.org/wiki/Hopcroft%E2%80%93Karp_algorithm
-# Bipartite Matching
-def solve(data: str) -> tuple[int, str]:
+def parse(data: str) -> Notes:
 
     # possibilities for every allergen
     possibilities: dict[Allergen, set[Ingredient]] = {}
@@ -25,48 +31,49 @@ def solve(data: str) -> tuple[int, str]:
             else:
                 possibilities[a] = set(ingre)
 
+    return possibilities, ingredient_count
+
+
+def part1(notes: Notes) -> int:
+    possibilities, ingredient_count = notes
+    ingredient_count = ingredient_count.copy()
+
     for ingredients in possibilities.values():
         for i in ingredients:
             if i in ingredient_count:
                 del ingredient_count[i]
 
-    p1 = ingredient_count.total()
-    done: list[tuple[Allergen, Ingredient]] = []
+    return ingredient_count.total()
 
-    # consecutively reduce every set to size 1
-    while len(possibilities) > 0:
-        # do we have a single element set?
-        for a, ingredients in possibilities.items():
-            if len(ingredients) == 1:
-                found = ingredients.pop()
-                done.append((a, found))
-                del possibilities[a]
-                break
-        # no further progress possible
-        else:
-            raise ValueError("Cant find all Allergens")
 
-        # remove newly found entry from other sets
-        for ingredients in possibilities.values():
-            ingredients.difference_update({found})
+# Bipartite Matching allergen <-> ingredient
+# the answer is only well defined if the maximum matching is perfect and unique
+def part2(notes: Notes) -> str:
+    possibilities, _ = notes
+    matching = hopcroft_karp(possibilities)
+    if len(matching) < len(possibilities):
+        raise ValueError("Cant find all Allergens")
+    if not is_unique(possibilities, matching):
+        raise ValueError("Allergens are ambiguous")
+    return ",".join(matching[a] for a in sorted(matching))
 
-    done = sorted(done)
-    p2 = ",".join(d[1] for d in done)
-
-    return p1, p2
 
+def solve(data: str) -> tuple[int, str]:
+    notes = parse(data)
+    return part1(notes), part2(notes)
 
-s = timer()
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+if __name__ == "__main__":
+    s = timer()
 
-p1, p2 = solve(data)
-print("Part 1:", p1)
-print("Part 2:", p2)
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
 
+    p1, p2 = solve(data)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
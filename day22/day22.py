@@ -1,9 +1,67 @@
 import os.path
 from timeit import default_timer as timer
 from collections import deque
+from collections.abc import Iterable
+from random import Random
 
 type Card = int
 type Deck = tuple[int, ...]
+type Snapshot = tuple[tuple[int, int], tuple[int, int]]  # (head, tail) of both HashedDecks
+
+
+# https://en.wikipedia.org/wiki/Zobrist_hashing
+# every card gets a random key, combined position aware as a polynomial in BASE:
+# fingerprint = sum(KEYS[c_i] * BASE^(n-1-i)) mod PRIME, so popleft and extend are O(1)
+PRIME = 2**61 - 1
+_rng = Random(2020)
+BASE = _rng.randrange(2**32, PRIME)
+KEYS: dict[Card, int] = {}
+POWERS: list[int] = [1]  # BASE^k mod PRIME
+
+
+class HashedDeck:
+    __slots__ = ('cards', 'head', 'size', 'fingerprint')
+
+    # cards is append only, the deck is cards[head:]
+    # earlier decks stay available for comparison via snapshots
+    def __init__(self, cards: Iterable[Card], max_size: int) -> None:
+        self.cards: list[Card] = []
+        self.head: int = 0
+        self.size: int = 0
+        self.fingerprint: int = 0
+        while len(POWERS) < max_size:
+            POWERS.append(POWERS[-1] * BASE % PRIME)
+        self.extend(cards)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def popleft(self) -> Card:
+        card = self.cards[self.head]
+        self.size -= 1
+        self.fingerprint = (self.fingerprint - KEYS[card] * POWERS[self.size]) % PRIME
+        self.head += 1
+        return card
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        fingerprint = self.fingerprint
+        for card in cards:
+            if card not in KEYS:
+                KEYS[card] = _rng.getrandbits(61)
+            fingerprint = (fingerprint * BASE + KEYS[card]) % PRIME
+            self.cards.append(card)
+            self.size += 1
+        self.fingerprint = fingerprint
+
+    def top(self, n: int) -> Deck:
+        return tuple(self.cards[self.head:self.head+n])
+
+    def snapshot(self) -> tuple[int, int]:
+        return self.head, len(self.cards)
+
+    def equals_snapshot(self, snapshot: tuple[int, int]) -> bool:
+        head, tail = snapshot
+        return tail-head == self.size and self.cards[head:tail] == self.cards[self.head:]
 
 
 def create_decks(data: str) -> tuple[Deck, Deck]:
@@ -13,6 +71,9 @@ def create_decks(data: str) -> tuple[Deck, Deck]:
     return deck1, deck2
 
 
+parse = create_decks
+
+
 def winning_score(deck: deque[int]) -> int:
     return sum(i*card for i, card in enumerate(reversed(deck), 1))
 
@@ -41,6 +102,10 @@ hits = 0
 misses = 0
 memo: dict[tuple[Deck, Deck], tuple[bool, deque[int]]] = {}
 
+# copying small decks in C is cheaper than updating fingerprints in python
+# measured break even: about 100 cards in the game
+HASHED_MIN_CARDS = 100
+
 
 def play_recursive_combat(deck1: Deck, deck2: Deck) -> tuple[bool, deque[int]]:
 
@@ -55,6 +120,19 @@ def play_recursive_combat(deck1: Deck, deck2: Deck) -> tuple[bool, deque[int]]:
     else:
         misses += 1
 
+    if len(deck1) + len(deck2) >= HASHED_MIN_CARDS:
+        p1_won, winner = play_rounds_hashed(deck1, deck2)
+    else:
+        p1_won, winner = play_rounds_tuples(deck1, deck2)
+
+    memo[(deck1, deck2)] = (p1_won, winner)
+    memo[(deck2, deck1)] = (not p1_won, winner)
+    return p1_won, winner
+
+
+# history holds the full decks of every round
+def play_rounds_tuples(deck1: Deck, deck2: Deck) -> tuple[bool, deque[int]]:
+
     # init qs and history
     p1, p2 = deque(deck1), deque(deck2)
     history: set[tuple[Deck, Deck]] = set()
@@ -66,8 +144,6 @@ def play_recursive_combat(deck1: Deck, deck2: Deck) -> tuple[bool, deque[int]]:
         # avoid infinite game
         curr_round = (tuple(p1), tuple(p2))
         if curr_round in history:
-            memo[(deck1, deck2)] = (True, p1)
-            memo[(deck2, deck1)] = (False, p1)
             return True, p1
         history.add(curr_round)
 
@@ -88,32 +164,79 @@ def play_recursive_combat(deck1: Deck, deck2: Deck) -> tuple[bool, deque[int]]:
 
         # do we have a winner?
         if len(p1) == 0:
-            memo[(deck1, deck2)] = (False, p2)
-            memo[(deck2, deck1)] = (True, p2)
             return False, p2
         elif len(p2) == 0:
-            memo[(deck1, deck2)] = (True, p1)
-            memo[(deck2, deck1)] = (False, p1)
             return True, p1
     else:
         raise ValueError(f"No Winner after {max_rounds} rounds.")
 
 
-s = timer()
+# history only holds fingerprints, decks are compared if the fingerprints collide
+def play_rounds_hashed(deck1: Deck, deck2: Deck) -> tuple[bool, deque[int]]:
+
+    # init decks and history
+    max_size = len(deck1) + len(deck2)
+    p1, p2 = HashedDeck(deck1, max_size), HashedDeck(deck2, max_size)
+    history: dict[tuple[int, int], list[Snapshot]] = {}
+
+    # start playing rounds
+    max_rounds = 10**5
+    for _ in range(max_rounds):
+
+        # avoid infinite game
+        key = (p1.fingerprint, p2.fingerprint)
+        if key in history:
+            if any(p1.equals_snapshot(s1) and p2.equals_snapshot(s2) for s1, s2 in history[key]):
+                return True, deque(p1.top(p1.size))
+            history[key].append((p1.snapshot(), p2.snapshot()))
+        else:
+            history[key] = [(p1.snapshot(), p2.snapshot())]
+
+        # draw cards
+        card1, card2 = p1.popleft(), p2.popleft()
+
+        # determine round winner
+        if p1.size >= card1 and p2.size >= card2:
+            p1_won, _ = play_recursive_combat(p1.top(card1), p2.top(card2))
+        else:
+            p1_won = True if card1 > card2 else False
+
+        # round winner takes cards
+        if p1_won:
+            p1.extend((card1, card2))
+        else:
+            p2.extend((card2, card1))
+
+        # do we have a winner?
+        if p1.size == 0:
+            return False, deque(p2.top(p2.size))
+        elif p2.size == 0:
+            return True, deque(p1.top(p1.size))
+    else:
+        raise ValueError(f"No Winner after {max_rounds} rounds.")
+
+
+def part1(decks: tuple[Deck, Deck]) -> int:
+    return play_combat(*decks)
+
+
+def part2(decks: tuple[Deck, Deck]) -> int:
+    _, winning_deck = play_recursive_combat(*decks)
+    return winning_score(winning_deck)
+
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+if __name__ == "__main__":
+    s = timer()
 
-deck1, deck2 = create_decks(data)
-print("Part 1:", play_combat(deck1, deck2))
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        decks = parse(f.read())
 
-p1_won, winning_deck = play_recursive_combat(deck1, deck2)
-part2 = winning_score(winning_deck)
-print("Part 2:", part2)
-print("using @cache: CacheInfo(hits=1672, misses=19570, maxsize=None, currsize=19570)")
-print(f"using custom cache: hits={hits}, misses={misses}, size={len(memo)}")
+    print("Part 1:", part1(decks))
+    print("Part 2:", part2(decks))
+    print("using @cache: CacheInfo(hits=1672, misses=19570, maxsize=None, currsize=19570)")
+    print(f"using custom cache: hits={hits}, misses={misses}, size={len(memo)}")
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
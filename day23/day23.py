@@ -1,7 +1,9 @@
 import os.path
 from timeit import default_timer as timer
+from array import array
 
 type Circle = list[Cup]
+type Successors = array[int]  # successors[val] = val of the next cup, index 0 unused
 
 
 class Cup:
@@ -43,7 +45,11 @@ def create_circle(initial: list[int], total: int | None = None) -> Circle:
     return circle
 
 
-def part1(circle: Circle) -> str:
+def parse(data: str) -> list[int]:
+    return list(map(int, data.strip()))
+
+
+def labels_after_one(circle: Circle) -> str:
     curr = circle[1].nxt
     res = ""
     for _ in range(len(circle)-2):
@@ -52,7 +58,7 @@ def part1(circle: Circle) -> str:
     return res
 
 
-def part2(circle: Circle) -> int:
+def stars_product(circle: Circle) -> int:
     return circle[1].nxt.val * circle[1].nxt.nxt.val
 
 
@@ -82,25 +88,97 @@ def play_cup_game(circle: Circle, curr: Cup, moves: int):
         curr = curr.nxt
 
 
-s = timer()
+# same circle without Cup objects: one flat int32 array, cup val == index
+def create_successors(initial: list[int], total: int | None = None) -> Successors:
+    total = len(initial) if not total else total
+    assert total >= len(initial), f"Cant fill up to {total} cups with {len(initial)} initially given"
+    assert total < 2**31, "Cup values must fit into int32"
+    successors: Successors = array("i", bytes(4*(total+1)))
 
+    last = 0
+    for num in initial:
+        successors[last] = num
+        last = num
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+    for num in range(len(initial)+1, total+1):
+        successors[last] = num
+        last = num
 
-initial = list(map(int, data))
-start = initial[0]
+    successors[last] = initial[0]
+    return successors
 
-circle = create_circle(initial)
-play_cup_game(circle, circle[start], 100)
-print("Part 1:", part1(circle))
 
-circle = create_circle(initial, 1_000_000)
-play_cup_game(circle, circle[start], 10_000_000)
-print("Part 2:", part2(circle))
+def labels_after_one_successors(successors: Successors) -> str:
+    curr = successors[1]
+    res = ""
+    for _ in range(len(successors)-2):
+        res += str(curr)
+        curr = successors[curr]
+    return res
+
+
+def stars_product_successors(successors: Successors) -> int:
+    return successors[1] * successors[successors[1]]
+
+
+def play_cup_game_successors(successors: Successors, curr: int, moves: int) -> None:
+    max_value = len(successors)-1
 
+    for _ in range(moves):
+        pick_up_begin = successors[curr]
+        pick_up_mid = successors[pick_up_begin]
+        pick_up_end = successors[pick_up_mid]
+
+        dest = curr
+        while True:
+            dest = max_value if dest == 1 else dest-1
+            if dest != pick_up_begin and dest != pick_up_mid and dest != pick_up_end:
+                break
 
-e = timer()
-print("time:", e - s)
+        successors[curr] = successors[pick_up_end]
+        successors[pick_up_end] = successors[dest]
+        successors[dest] = pick_up_begin
+        curr = successors[curr]
+
+
+def part1(initial: list[int], mode: str = "array") -> str:
+    match mode:
+        case "array":
+            successors = create_successors(initial)
+            play_cup_game_successors(successors, initial[0], 100)
+            return labels_after_one_successors(successors)
+        case "linked":
+            circle = create_circle(initial)
+            play_cup_game(circle, circle[initial[0]], 100)
+            return labels_after_one(circle)
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+def part2(initial: list[int], mode: str = "array") -> int:
+    match mode:
+        case "array":
+            successors = create_successors(initial, 1_000_000)
+            play_cup_game_successors(successors, initial[0], 10_000_000)
+            return stars_product_successors(successors)
+        case "linked":
+            circle = create_circle(initial, 1_000_000)
+            play_cup_game(circle, circle[initial[0]], 10_000_000)
+            return stars_product(circle)
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+if __name__ == "__main__":
+    s = timer()
+
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        initial = parse(f.read())
+
+    print("Part 1:", part1(initial))
+    print("Part 2:", part2(initial))
+
+    e = timer()
+    print("time:", e - s)
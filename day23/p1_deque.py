@@ -60,17 +60,18 @@ def play_cup_game(cups: Cups, moves: int) -> str:
     return res[:-1]
 
 
-s = timer()
+if __name__ == "__main__":
+    s = timer()
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
 
-cups = list(map(int, data))
-assert (len(cups)) >= 5, "Need at least five cups to play the game"
-p1 = play_cup_game(cups, 100)
-print("Part 1:", p1)
+    cups = list(map(int, data))
+    assert (len(cups)) >= 5, "Need at least five cups to play the game"
+    p1 = play_cup_game(cups, 100)
+    print("Part 1:", p1)
 
-e = timer()
-print("time:", e - s)
+    e = timer()
+    print("time:", e - s)
@@ -24,6 +24,10 @@ DIRS: dict[str, Dir] = {
 # seems these are called "Doubled coordinates"
 # see https://www.redblobgames.com/grids/hexagons/#neighbors-doubled
 
+# "Axial coordinates" (q,r) = ((x-y)/2, y) have no holes
+# see https://www.redblobgames.com/grids/hexagons/#coordinates-axial
+AXIAL_DIRS: list[Dir] = [(1, 0), (-1, 0), (1, -1), (-1, 1), (0, 1), (0, -1)]  # (q,r)
+
 
 def flip_tiles(data: str) -> set[Tile]:
     black: set[Tile] = set()
@@ -40,6 +44,9 @@ def flip_tiles(data: str) -> set[Tile]:
     return black
 
 
+parse = flip_tiles
+
+
 def conway(black: set[Tile], num_days: int = 100) -> set[Tile]:
     dirs = DIRS.values()
     for _ in range(num_days):
@@ -91,22 +98,69 @@ def conway_convolve(black: set[Tile], num_days: int = 100) -> int:
     return tiles.sum()
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+def conway_axial(black: set[Tile], num_days: int = 100) -> int:
+    if not black:
+        return 0
+    q, r = map(sorted, zip(*(((x-y)//2, y) for x, y in black)))
+    q_min, r_min = q[0], r[0]
+
+    # black tiles grow at most one ring per day, plus a border which always stays white
+    pad = num_days + 1
+    dimq, dimr = q[-1]-q_min+1 + 2*pad, r[-1]-r_min+1 + 2*pad
+    tiles = np.zeros((dimr, dimq), dtype=bool)
+    for x, y in black:
+        tiles[y-r_min+pad, (x-y)//2-q_min+pad] = True
+
+    # double buffer, every day writes into the other one
+    buffer = np.zeros_like(tiles)
+    inner = (slice(1, -1), slice(1, -1))
+    neighbors = np.zeros((dimr-2, dimq-2), dtype=np.uint8)
+    one_neighbor = np.zeros((dimr-2, dimq-2), dtype=bool)
+    shifted = [(slice(1+dr, dimr-1+dr), slice(1+dq, dimq-1+dq)) for dq, dr in AXIAL_DIRS]
+
+    for _ in range(num_days):
+        neighbors.fill(0)
+        for view in shifted:
+            np.add(neighbors, tiles[view], out=neighbors)
+
+        # black stays black with 1 or 2 black neighbors, every tile is black with exactly 2
+        new_tiles = buffer[inner]
+        np.equal(neighbors, 2, out=new_tiles)
+        np.equal(neighbors, 1, out=one_neighbor)
+        np.logical_and(one_neighbor, tiles[inner], out=one_neighbor)
+        np.logical_or(new_tiles, one_neighbor, out=new_tiles)
+        tiles, buffer = buffer, tiles
+
+    return int(np.count_nonzero(tiles))
+
+
+def part1(black: set[Tile]) -> int:
+    return len(black)
+
+
+def part2(black: set[Tile]) -> int:
+    return conway_axial(black, 100)
+
 
-black = flip_tiles(data)
-print("Part 1:", len(black))
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        black = parse(f.read())
 
+    print("Part 1:", part1(black))
 
-s = timer()
-p2 = conway_convolve(black, 100)
-e = timer()
-print(f"Part 2 (convolve): {p2} (time: {e-s})")
+    s = timer()
+    p2 = conway_axial(black, 100)
+    e = timer()
+    print(f"Part 2 (axial): {p2} (time: {e-s})")
 
+    s = timer()
+    p2 = conway_convolve(black, 100)
+    e = timer()
+    print(f"Part 2 (convolve): {p2} (time: {e-s})")
 
-s = timer()
-black = conway(black, 100)
-e = timer()
-print(f"Part 2 (sets): {len(black)} (time: {e-s})")
+    s = timer()
+    black = conway(black, 100)
+    e = timer()
+    print(f"Part 2 (sets): {len(black)} (time: {e-s})")
@@ -1,35 +1,124 @@
 import os.path
 from timeit import default_timer as timer
+from math import gcd, isqrt, prod
 
 
-def decode(subject: int, public_key: int) -> int:
+MODULUS = 20201227  # prime, MODULUS-1 = 2*3*29*116099
+
+
+def parse(data: str) -> tuple[int, int]:
+    door_public, card_public = map(int, data.splitlines()[:2])
+    return door_public, card_public
+
+
+# smallest loop size n >= 1 with subject^n == public_key (mod modulus)
+def decode(subject: int, public_key: int, modulus: int = MODULUS, mode: str = "pohlig_hellman") -> int:
+    match mode:
+        case "linear":
+            return decode_linear(subject, public_key, modulus)
+        case "bsgs" | "pohlig_hellman":
+            # both fast modes need subject to be invertible, otherwise fall back to scanning
+            if gcd(subject, modulus) != 1:
+                return decode_linear(subject, public_key, modulus)
+            # pohlig hellman works in a group of order modulus-1, so the order of subject has to divide it
+            # always true for a prime modulus (fermat), otherwise use bsgs over the whole range
+            if mode == "pohlig_hellman" and pow(subject, modulus-1, modulus) == 1:
+                return pohlig_hellman(subject, public_key, modulus)
+            return baby_step_giant_step(subject, public_key, modulus, modulus)
+        case _:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+
+def decode_linear(subject: int, public_key: int, modulus: int = MODULUS) -> int:
     val: int = 1
     for n in range(10**8):
         val *= subject
-        val %= 20201227
+        val %= modulus
         if val == public_key:
             return n+1
     else:
         raise ValueError("Max iterations reached")
 
 
-s = timer()
+# https://en.wikipedia.org/wiki/Baby-step_giant-step
+# smallest n in [1, bound] with subject^n == public_key, n = i*m + j
+def baby_step_giant_step(subject: int, public_key: int, modulus: int, bound: int) -> int:
+    m = isqrt(bound) + 1
+
+    baby_steps: dict[int, int] = {}
+    val = 1
+    for j in range(1, m+1):
+        val = val * subject % modulus
+        baby_steps.setdefault(val, j)
+
+    giant_step = pow(subject, -m, modulus)
+    val = public_key % modulus
+    for i in range(m):
+        if val in baby_steps:
+            return i*m + baby_steps[val]
+        val = val * giant_step % modulus
+
+    raise ValueError(f"{public_key} is no power of {subject} mod {modulus}")
+
+
+# https://en.wikipedia.org/wiki/Pohlig%E2%80%93Hellman_algorithm
+# solve the log in every prime power subgroup of the order, then combine via CRT
+def pohlig_hellman(subject: int, public_key: int, modulus: int) -> int:
+    # order of subject divides the group order modulus-1
+    order = modulus-1
+    for q in factorize(order):
+        while order % q == 0 and pow(subject, order // q, modulus) == 1:
+            order //= q
+
+    rem, num = [], []
+    for q, e in factorize(order).items():
+        # generator of the subgroup of order q
+        gen = pow(subject, order // q, modulus)
+        x = 0
+        # one base q digit per step
+        for k in range(e):
+            target = pow(public_key * pow(subject, -x, modulus), order // q**(k+1), modulus)
+            digit = 0 if target == 1 else baby_step_giant_step(gen, target, modulus, q)
+            x += digit * q**k
+        rem.append(x)
+        num.append(q**e)
+
+    N = prod(num)
+    x = sum(r * (N // n) * pow(N // n, -1, n) for r, n in zip(rem, num)) % N
+    if pow(subject, x, modulus) != public_key % modulus:
+        raise ValueError(f"{public_key} is no power of {subject} mod {modulus}")
+    return x if x > 0 else order
+
+
+def factorize(n: int) -> dict[int, int]:
+    factors: dict[int, int] = {}
+    q = 2
+    while q*q <= n:
+        while n % q == 0:
+            factors[q] = factors.get(q, 0) + 1
+            n //= q
+        q += 1
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+def part1(public_keys: tuple[int, int]) -> int:
+    door_public, card_public = public_keys
+    door_loop = decode(7, door_public)
+    # card_loop = decode(7, card_public)
+    return pow(card_public, door_loop, MODULUS)
 
-door_public = int(data[0])
-card_public = int(data[1])
 
-door_loop = decode(7, door_public)
-# card_loop = decode(7, card_public)
+if __name__ == "__main__":
+    s = timer()
 
-encryption_key = pow(card_public, door_loop, 20201227)
-print("Part 1:", encryption_key)
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        public_keys = parse(f.read())
 
+    print("Part 1:", part1(public_keys))
 
-e = timer()
-print(f"time: {e-s}")
+    e = timer()
+    print(f"time: {e-s}")
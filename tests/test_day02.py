@@ -0,0 +1,29 @@
+import pytest
+
+from day02.day02 import parse, parse_columns, part1, part1_columns, part2, part2_columns
+
+
+# passwords containing "-" and ":" must not shift the fields of later lines
+def test_bulk_agrees_with_per_line() -> None:
+    data = "1-3 a: ab-c\n2-4 b: bbbb\n1-5 a: a:b-a\n3-4 c: -cc-\n2-9 c: cccccccc-\n"
+    policies = parse(data)
+    columns = parse_columns(data)
+    assert part1_columns(columns) == part1(policies) == 4
+    assert part2_columns(columns) == part2(policies) == 3
+
+
+def test_single_line_with_dash_in_password() -> None:
+    columns = parse_columns("1-3 a: ab-c")
+    assert part1_columns(columns) == part1(parse("1-3 a: ab-c")) == 1
+
+
+def test_empty_input() -> None:
+    columns = parse_columns("")
+    assert part1_columns(columns) == part1(parse("")) == 0
+    assert part2_columns(columns) == part2(parse("")) == 0
+
+
+@pytest.mark.parametrize("data", ["1-3 a: ab-c\n2-4 b: bbb\n13 a: abc\n", "1-3 a abc\n", "13 a: a-b\n"])
+def test_malformed_line(data: str) -> None:
+    with pytest.raises(ValueError):
+        parse_columns(data)
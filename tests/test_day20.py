@@ -0,0 +1,32 @@
+import numpy as np
+
+from day20.day20 import SIDES, Tile, edge_code
+
+
+def test_edge_code_wider_than_64_cells() -> None:
+    edge = np.ones(96, dtype=int)
+    assert edge_code(edge) == (1 << 96) - 1
+
+    edge = np.zeros(96, dtype=int)
+    edge[0] = 1
+    assert edge_code(edge) == 1 << 95
+    assert edge_code(edge[::-1]) == 1
+
+
+# the table agrees with the edges of the actually rotated/flipped matrix
+def test_orientations_of_wide_tile() -> None:
+    rng = np.random.default_rng(20)
+    tile = Tile(0, rng.integers(0, 2, (96, 96)))
+    for k, edges in enumerate(tile.orientations):
+        tile.orient(k)
+        m = tile.matrix
+        assert edges == tuple(map(edge_code, (m[0, :], m[:, -1], m[-1, :], m[:, 0])))
+
+
+def test_transform_keeps_edges_in_sync() -> None:
+    rng = np.random.default_rng(20)
+    tile = Tile(0, rng.integers(0, 2, (10, 10)))
+    for k, _ in enumerate(tile.transform()):
+        assert tile.orientation == k
+        m = tile.matrix
+        assert tuple(tile.get_edge(d) for d in SIDES) == tuple(map(edge_code, (m[0, :], m[:, -1], m[-1, :], m[:, 0])))
@@ -0,0 +1,49 @@
+import random
+
+from aoc.matching import forced_pairs, hopcroft_karp, is_unique
+
+
+def random_graph(rng: random.Random) -> dict[int, set[str]]:
+    right = "abcdef"[:rng.randint(1, 6)]
+    return {u: {v for v in right if rng.random() < 0.4} for u in range(rng.randint(1, 6))}
+
+
+# every maximum matching by enumeration, each as a set of (left, right) pairs
+def brute_force(graph: dict[int, set[str]]) -> list[set[tuple[int, str]]]:
+    left = list(graph)
+    matchings: list[set[tuple[int, str]]] = []
+
+    def extend(i: int, pairs: set[tuple[int, str]], used: set[str]) -> None:
+        if i == len(left):
+            matchings.append(set(pairs))
+            return
+        extend(i+1, pairs, used)
+        for v in graph[left[i]] - used:
+            extend(i+1, pairs | {(left[i], v)}, used | {v})
+
+    extend(0, set(), set())
+    size = max(map(len, matchings))
+    return [m for m in matchings if len(m) == size]
+
+
+def test_hopcroft_karp_matches_brute_force() -> None:
+    rng = random.Random(2020)
+    for _ in range(500):
+        graph = random_graph(rng)
+        maximum = brute_force(graph)
+        matching = hopcroft_karp(graph)
+
+        assert all(v in graph[u] for u, v in matching.items())
+        assert len(set(matching.values())) == len(matching)
+        assert len(matching) == len(maximum[0])
+
+        forced = set.intersection(*maximum)
+        assert set(forced_pairs(graph, matching).items()) == forced
+        assert is_unique(graph, matching) == (len(maximum) == 1)
+
+
+def test_day21_example() -> None:
+    graph = {"dairy": {"mxmxvkd"}, "fish": {"mxmxvkd", "sqjhc"}, "soy": {"sqjhc", "fvjkl"}}
+    matching = hopcroft_karp(graph)
+    assert matching == {"dairy": "mxmxvkd", "fish": "sqjhc", "soy": "fvjkl"}
+    assert is_unique(graph, matching)